@@ -0,0 +1,250 @@
+"""Benchmark build.py on synthetic inputs of growing size.
+
+Generates publication_list.bib, preprint_list.bib, talk_list.bib, award_list.bib and news_list.json
+with 10, 100, 1k and 10k entries in a scratch directory, times each build stage there and records
+peak traced memory per stage. Results go to a JSON file; pass an earlier one with --compare to flag
+regressions, e.g.
+
+    python benchmarks/benchmark.py --sizes 10 100 1000 -o before.json
+    python benchmarks/benchmark.py --sizes 10 100 1000 --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import build  # noqa: E402
+
+SIZES = (10, 100, 1000, 10000)
+FIRST_NAMES = ['Dongjae', 'Bumjun', 'Moongyu', 'Albert', 'Wonje', 'Taeheon', 'Jonghyun', 'Mingyu', 'Sangwoo',
+               'Jiwon', 'Hyunjin', 'Seungho', 'Yuna', 'Minseo', 'Jörg', 'Zoë', 'François', 'Andreas', 'Jon', 'Michael']
+LAST_NAMES = ['Jeon', 'Kim', 'No', 'Jeung', 'Choi', 'Park', 'Lee', 'Cho', 'Yoon', 'Han', 'Müller', 'Barron',
+              'Geiger', 'Niemeyer', 'Dupré', 'Nguyen', 'Smith', 'García', 'Kang', 'Shin']
+VENUES = ['ICML', 'NeurIPS', 'ICLR', 'CVPR', 'ICCV', 'ECCV', 'ACL', 'EMNLP', 'AAAI', 'NeurIPS Workshop']
+WORDS = ['diffusion', 'language', 'models', 'parallel', 'decoding', 'quantization', 'attention', 'privacy', 'safety',
+         'efficient', 'training', 'generative', 'reasoning', 'sampling', 'alignment', 'robust', 'scalable', 'sparse',
+         'memorization', 'unlearning', 'benchmark', 'latent', 'guidance', 'adapters', 'jailbreak', 'tokens']
+
+# Stages reported, in order (see run_stages)
+STAGES = ['parse', 'generate_person_html', 'get_paper_entry', 'news', 'talks', 'css', 'write', 'minify_css']
+
+
+def make_authors(rng):
+    names = [f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}' for _ in range(rng.randint(2, 12))]
+    if rng.random() < 0.7:
+        names[rng.randrange(len(names))] = 'Dongjae Jeon'
+    return list(dict.fromkeys(names))
+
+
+def make_sentence(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def make_paper_bib(rng, n, prefix):
+    entries = []
+    for i in range(n):
+        authors = make_authors(rng)
+        fields = {
+            'title': make_sentence(rng, rng.randint(5, 12)),
+            'author': ' and '.join(f'{name.split(" ", 1)[1]}, {name.split(" ", 1)[0]}' for name in authors),
+            'coauthor': ', '.join(authors[:rng.randint(0, 3)]),
+            'booktitle': rng.choice(VENUES),
+            'year': str(rng.randint(2018, 2026)),
+            'pub_id': f'{prefix}{n - i}',
+            'html': f'https://arxiv.org/abs/2{rng.randint(100, 999)}.{rng.randint(10000, 99999)}',
+            'img': f'assets/img/publications/synthetic{i % 50}.png',
+            'tldr': '. '.join(make_sentence(rng, rng.randint(12, 25)) for _ in range(2)) + '.',
+        }
+        if rng.random() < 0.5:
+            fields['code'] = f'https://github.com/example/repo{i}'
+        if rng.random() < 0.1:
+            fields['award'] = 'Spotlight'
+        body = ',\n'.join(f'  {k} = {{{v}}}' for k, v in fields.items())
+        entries.append(f'@inproceedings{{{prefix.lower()}{i},\n{body},\n}}\n')
+    return '\n'.join(entries)
+
+
+def make_talk_bib(rng, n):
+    return '\n'.join(
+        f'@inproceedings{{talk{i},\n  title={{{make_sentence(rng, 6)}}},\n  booktitle={{{rng.choice(VENUES)} Seminar}},\n'
+        f'  year={{{rng.randint(2018, 2026)}}},\n  img = {{assets/img/talks/synthetic.png}},\n}}\n'
+        for i in range(n))
+
+
+def make_award_bib(rng, n):
+    return '\n'.join(
+        f'@misc{{award{i},\n  title={{{make_sentence(rng, 4)}}},\n  booktitle={{{rng.choice(VENUES)}}},\n'
+        f'  year={{{rng.randint(2018, 2026)}}},\n  rank={{{rng.choice(["1st", "2nd", "3rd"])}}},\n}}\n'
+        for i in range(n))
+
+
+def make_news(rng, n):
+    return [{'month': rng.randint(1, 12), 'year': rng.randint(2018, 2026), 'content': make_sentence(rng, 15) + '!'}
+            for _ in range(n)]
+
+
+def write_inputs(directory, n, seed=0):
+    """Synthetic inputs with n publications, news items and talks, and n // 10 preprints and awards"""
+    rng = random.Random(seed)
+    files = {
+        'publication_list.bib': make_paper_bib(rng, n, 'C'),
+        'preprint_list.bib': make_paper_bib(rng, max(n // 10, 1), 'P'),
+        'talk_list.bib': make_talk_bib(rng, n),
+        'award_list.bib': make_award_bib(rng, max(n // 10, 1)),
+        'news_list.json': json.dumps(make_news(rng, n)),
+    }
+    for name, content in files.items():
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(content)
+
+
+def run_stages():
+    """(stage, callable) pairs, to be run in order in the directory holding the inputs"""
+    entries = {}
+
+    def parse():
+        entries.update(build.load_bib('publication_list.bib'))
+
+    def person_html():
+        for entry in entries.values():
+            build.generate_person_html(entry.persons['author'], entry.fields.get('coauthor', ''))
+
+    def paper_entry():
+        for i, (key, entry) in enumerate(entries.items()):
+            build.get_paper_entry(key, entry, paper_num=i + 1)
+
+    def write():
+        with contextlib.redirect_stdout(io.StringIO()):
+            build.write_index_html('index.html', incremental=False)
+
+    def minify_css():
+        with open('index.html') as f, contextlib.redirect_stdout(io.StringIO()):
+            build.minify_page_css(f.read())
+
+    return [
+        ('parse', parse),
+        ('generate_person_html', person_html),
+        ('get_paper_entry', paper_entry),
+        ('news', build.get_news_html),
+        ('talks', build.get_talks_html),
+        ('css', build.get_page_css),
+        ('write', write),
+        ('minify_css', minify_css),
+    ]
+
+
+def bench_size(n, repeat):
+    """{stage: {'seconds': best wall time of repeat runs, 'peak_kib': traced peak of one run}}"""
+    results = {stage: {'seconds': float('inf')} for stage in STAGES}
+    with tempfile.TemporaryDirectory() as directory:
+        write_inputs(directory, n)
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            for _ in range(repeat):
+                build.clear_caches()
+                for stage, run in run_stages():
+                    start = time.perf_counter()
+                    run()
+                    results[stage]['seconds'] = min(results[stage]['seconds'], time.perf_counter() - start)
+            # Memory in a separate pass, as tracing slows allocation-heavy stages down
+            build.clear_caches()
+            tracemalloc.start()
+            for stage, run in run_stages():
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                run()
+                results[stage]['peak_kib'] = round((tracemalloc.get_traced_memory()[1] - base) / 1024, 1)
+            tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def get_meta():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pybtex': build.pybtex.__version__,
+        'machine': f'{platform.system()} {platform.machine()}',
+    }
+
+
+def print_table(results, baseline=None):
+    for size, stages in results.items():
+        print(f'\n{size} entries')
+        print(f'  {"stage":<22}{"time (ms)":>12}{"peak (KiB)":>14}' + ('  vs baseline' if baseline else ''))
+        for stage, r in stages.items():
+            line = f'  {stage:<22}{r["seconds"] * 1000:>12.2f}{r["peak_kib"]:>14.1f}'
+            old = (baseline or {}).get(size, {}).get(stage)
+            if old:
+                line += f'  {r["seconds"] / old["seconds"]:>6.2f}x time, {r["peak_kib"] / max(old["peak_kib"], 0.1):.2f}x memory'
+            print(line)
+
+
+def find_regressions(results, baseline, threshold):
+    """Stages more than threshold (e.g. 0.2 = 20%) slower than the baseline, ignoring sub-millisecond ones"""
+    regressions = []
+    for size, stages in results.items():
+        for stage, r in stages.items():
+            old = baseline.get(size, {}).get(stage)
+            if old and max(r['seconds'], old['seconds']) > 1e-3 and r['seconds'] > old['seconds'] * (1 + threshold):
+                regressions.append(f'{stage} at {size} entries: {old["seconds"] * 1000:.1f} ms -> {r["seconds"] * 1000:.1f} ms')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time build.py stages on synthetic inputs.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='numbers of entries (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per size, the best one is kept')
+    parser.add_argument('-o', '--output', help='results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', metavar='RESULTS', help='earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown reported as a regression with --compare (default: 0.2)')
+    args = parser.parse_args(argv)
+
+    build.build_options['cache'] = False
+    meta = get_meta()
+    results = {}
+    for n in args.sizes:
+        print(f'Benchmarking {n} entries...')
+        results[str(n)] = bench_size(n, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    print_table(results, baseline)
+
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results', f'{meta["commit"] or "results"}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=2)
+    print(f'\nResults written to {output}.')
+
+    if baseline:
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'Regression: {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
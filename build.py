@@ -1,6 +1,63 @@
 from pybtex.database.input import bibtex
-from pybtex.database import parse_file
+from pybtex.database import parse_file, Entry, Person
+import pybtex
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import base64
+import calendar
+import contextlib
+import cProfile
+import glob
+import gzip
+import hashlib
+import io
 import json
+import os
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+import unicodedata
+from html import escape, unescape
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Pillow is only needed for --responsive-images
+    Image = None
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:  # fontTools (+ brotli for WOFF2) is only needed for --self-host-fonts
+    font_subset = None
+
+try:
+    import markdown
+except ImportError:  # Only needed to build blog posts from Markdown sources
+    markdown = None
+
+try:
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # Blog code blocks stay unhighlighted without Pygments
+    highlight = None
+
+try:
+    from latex2mathml.converter import convert as latex_to_mathml
+except ImportError:  # Blog math stays as LaTeX source without latex2mathml
+    latex_to_mathml = None
+
+try:
+    import brotli
+except ImportError:  # Without it --precompress writes only .gz sidecars
+    brotli = None
 
 # Modern color palette inspired by Yang Song's site
 colors = {
@@ -14,6 +71,75 @@ colors = {
     'tag_efficient': '#198754', # Green for Efficient ML tag
 }
 
+# Build state (fragment manifest, caches) lives here between runs
+BUILD_DIR = '.build'
+
+# Input files by kind, see get_input(). The authors file lists coauthor homepages as
+# [{"name": ..., "url": ..., "aliases": [...]}], see get_author_index()
+DEFAULT_INPUTS = {
+    'preprints': 'preprint_list.bib',
+    'publications': 'publication_list.bib',
+    'talks': 'talk_list.bib',
+    'awards': 'award_list.bib',
+    'news': 'news_list.json',
+    'authors': 'author_list.json',
+    'profile_image': 'assets/img/profile2.jpg',
+}
+
+# Per-site config read by `build.py batch`: {"personal": {...}, "inputs": {...}}, see load_site_config()
+SITE_CONFIG = 'site.json'
+
+# Set from the command line, see main()
+build_options = {
+    'cache': True,
+    'responsive_images': False,
+    'gif_video': False,
+    'minify_css': False,
+    'critical_css': False,
+    'self_host_fonts': False,
+    'icon_sprite': False,
+    'minify_html': {},  # Output ('index', 'blog', '*' for any) -> 'safe' or 'aggressive'
+    'precompress': False,
+    'fingerprint': False,
+    'search': False,
+    'paginate_publications': 0,  # Entries rendered inline, the rest fetched in chunks of as many (0: all inline)
+    'profile': False,
+    'inputs': dict(DEFAULT_INPUTS),
+    'personal': {},  # Overrides of get_personal_data() fields, from a batch site config
+    'shared_cache': None,  # Build dir for caches shared by all sites of a batch build, see get_cache_dir()
+}
+
+# (stage, wall s, CPU s, allocated bytes, peak bytes) recorded with --profile, see profile_stage()
+profile_stages = []
+
+CSS_DIR = 'assets/css'
+POST_DIR = 'posts'  # Markdown sources with front matter, rendered to blog/<slug>.html
+BLOG_DIR = 'blog'
+FONT_DIR = 'assets/fonts'
+ICON_DIR = 'assets/icons'  # Font Awesome Free SVGs (CC BY 4.0), laid out as <style>/<name>.svg
+
+# Fingerprinted copies of referenced assets (named <name>.<hash>.<ext>) and their manifests
+FINGERPRINT_DIR = 'assets/fp'
+ASSET_MANIFEST = 'asset-manifest.json'
+HEADERS_FILE = '_headers'
+
+# Content-hashed search index (index.<hash>.json) fetched by the search box with --search
+SEARCH_DIR = 'assets/search'
+SEARCH_STOP_WORDS = {'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'of', 'on',
+                     'or', 'that', 'the', 'this', 'to', 'we', 'with'}
+
+# Chunks of peer-reviewed entries (pubs.<hash>.html) fetched on demand with --paginate-publications
+PUB_CHUNK_DIR = 'assets/pubs'
+
+# Generated text artifacts that get .gz/.br sidecars with --precompress
+PRECOMPRESS_PATTERNS = ['index.html', 'blog/*.html', f'{CSS_DIR}/*.css', f'{SEARCH_DIR}/*.json',
+                        f'{PUB_CHUNK_DIR}/*.html', f'{FINGERPRINT_DIR}/**/*.js', f'{FINGERPRINT_DIR}/**/*.svg']
+PRECOMPRESS_EXTS = ('.gz', '.br')
+
+# Thumbnails are shown 180px wide; variants are rendered at 1x and 2x of that
+IMAGE_WIDTHS = (180, 360)
+IMAGE_VARIANT_DIR = 'assets/img/variants'
+
 
 def get_personal_data():
     name = ["Dongjae", "Jeon"]
@@ -48,7 +174,7 @@ Ultimately, I aim to deepen our understanding of machine perception and translat
 </p>
 """
     
-    return {
+    data = {
         'name': name,
         'title': title,
         'affiliation': affiliation,
@@ -59,40 +185,138 @@ Ultimately, I aim to deepen our understanding of machine perception and translat
         'cv': cv,
         'bio': bio_text
     }
+    data.update(build_options['personal'])
+    return data
 
 
-def get_author_dict():
-    return {
-        'Wonje Jeung': 'https://cryinginitial.github.io',
-        'Taeheon Kim': 'https://ta3h30nk1m.github.io',
-        'Albert No': 'https://albert-no.github.io/team/',
-        'Jonghyun Choi': 'https://ppolon.github.io',
-        'Mingyu Kim': 'https://mingyukim87.github.io/',
-        }
+def get_input(kind):
+    """Path of an input file ('publications', 'news', ...), relative to the site being built"""
+    return build_options['inputs'][kind]
+
+
+def get_cache_dir():
+    """Where content-keyed caches live: the build dir, or the directory shared by a batch build's sites"""
+    return build_options['shared_cache'] or BUILD_DIR
+
+
+def get_font_files():
+    """Local font sources for --self-host-fonts: (family, weight, style, file)"""
+    return [
+        ('Source Sans Pro', 400, 'normal', f'{FONT_DIR}/src/SourceSansPro-Regular.ttf'),
+        ('Source Sans Pro', 600, 'normal', f'{FONT_DIR}/src/SourceSansPro-Semibold.ttf'),
+        ('Source Sans Pro', 700, 'normal', f'{FONT_DIR}/src/SourceSansPro-Bold.ttf'),
+        ('Source Sans Pro', 400, 'italic', f'{FONT_DIR}/src/SourceSansPro-It.ttf'),
+    ]
+
+
+# In-process memos, see clear_caches(): name -> normalize_name() key, authors file path -> (digest, compiled
+# index), bib 'coauthor' field -> normalized names
+_name_keys = {}
+_author_indexes = {}
+_coauthor_names = {}
+
+
+def normalize_name(name):
+    """Key for matching author names, ignoring case, diacritics (also LaTeX accents), periods, hyphens and spacing"""
+    if name not in _name_keys:
+        plain = re.sub(r'\\[`\'"^~=.uvHckrbd]\s*|[{}]', '', name)
+        plain = ''.join(c for c in unicodedata.normalize('NFKD', plain) if not unicodedata.combining(c))
+        _name_keys[name] = ' '.join(re.sub(r'[.\-\u2010]', ' ', plain).split()).casefold()
+    return _name_keys[name]
+
 
+def get_initials_key(name):
+    """('b j kim' for 'Bum-Jun Kim', whether the given names are initials only), or (None, False)"""
+    person = Person(name)
+    given = normalize_name(' '.join(person.first_names + person.middle_names)).split()
+    last = normalize_name(' '.join(person.prelast_names + person.last_names))
+    if not given or not last:
+        return None, False
+    return ' '.join([g[0] for g in given] + [last]), all(len(g) == 1 for g in given)
 
-def generate_person_html(persons, coauthor, connection=", ", make_bold=True, make_bold_name='Dongjae Jeon', add_links=True):
-    links = get_author_dict() if add_links else {}
-    s = ""
+
+def compile_author_index(authors):
+    """Lookup tables for the author list: normalized name or alias -> url, and initials form -> url.
+
+    An initials form shared by different authors maps to None, so it never links to the wrong person.
+    """
+    names, initials = {}, {}
+    for author in authors:
+        for name in [author['name']] + author.get('aliases', []):
+            person = Person(name)
+            for parts in (person.first_names + person.middle_names, person.first_names):
+                names[normalize_name(' '.join(parts + person.prelast_names + person.last_names))] = author['url']
+            key, _ = get_initials_key(name)
+            if key:
+                initials[key] = author['url'] if initials.get(key, author['url']) == author['url'] else None
+    return {'names': names, 'initials': initials}
+
+
+def get_author_index():
+    """Compiled author lookup, rebuilt only when the authors file (or this script) changes.
+
+    Cached in the build dir between runs and in memory within one.
+    """
+    path = get_input('authors')
+    digest = hash_file(path)
+    memo_key = os.path.abspath(path)
+    if memo_key in _author_indexes and _author_indexes[memo_key][0] == digest:
+        return _author_indexes[memo_key][1]
+    stamp = [digest, hash_file(__file__)]
+    cache_file = os.path.join(get_cache_dir(), f'author_index-{get_path_key(path)}.json')
+    cached = load_manifest(cache_file) if build_options['cache'] else {}
+    if cached.get('stamp') == stamp:
+        index = cached['index']
+    else:
+        authors = []
+        if digest:
+            with open(path, 'r') as f:
+                authors = json.load(f)
+        index = compile_author_index(authors)
+        if build_options['cache']:
+            save_manifest({'stamp': stamp, 'index': index}, cache_file)
+    _author_indexes[memo_key] = digest, dict(index, lookups={})  # lookups: display name -> link, see find_author_link()
+    return _author_indexes[memo_key][1]
+
+
+def find_author_link(name, index):
+    """Homepage of an author by display name: exact/alias match first, then by initials ('B. Kim')"""
+    links = index['lookups']
+    if name not in links:
+        link = index['names'].get(normalize_name(name))
+        if link is None:
+            key, initials_only = get_initials_key(name)
+            link = index['initials'].get(key) if initials_only else None
+        links[name] = link
+    return links[name]
+
+
+def parse_coauthors(coauthor):
+    """Normalized names listed in a bib 'coauthor' field ('A B, C D' or 'A B and C D')"""
+    if coauthor not in _coauthor_names:
+        _coauthor_names[coauthor] = frozenset(normalize_name(name) for name in re.split(r',|\band\b', coauthor)
+                                              if name.strip())
+    return _coauthor_names[coauthor]
+
+
+def generate_person_html(persons, coauthor, connection=", ", make_bold=True, make_bold_name=None, add_links=True):
+    """Author list html; make_bold_name defaults to the site owner's name"""
+    index = get_author_index() if add_links else None
+    equal_contribution = parse_coauthors(coauthor)
+    bold_key = normalize_name(make_bold_name or ' '.join(get_personal_data()['name'])) if make_bold else None
+    parts = []
     for p in persons:
-        string_part_i = ""
-        for name_part_i in p.get_part('first') + p.get_part('last'): 
-            if string_part_i != "":
-                string_part_i += " "
-            string_part_i += name_part_i
-        star = "" if string_part_i not in coauthor else "*"
-            
-        if make_bold and string_part_i == make_bold_name:
-            string_part_i = f'<strong>{string_part_i}{star}</strong>'
-        elif string_part_i in links.keys():
-            string_part_i = f'<a href="{links[string_part_i]}" target="_blank">{string_part_i}{star}</a>'
+        name = ' '.join(p.first_names + p.last_names)  # Middle names are not shown
+        key = normalize_name(name)
+        star = "*" if key in equal_contribution else ""
+        link = find_author_link(name, index) if index else None
+        if key == bold_key:
+            parts.append(f'<strong>{name}{star}</strong>')
+        elif link:
+            parts.append(f'<a href="{link}" target="_blank">{name}{star}</a>')
         else:
-            string_part_i = f'{string_part_i}{star}'
-            
-        if p != persons[-1]:
-            string_part_i += connection
-        s += string_part_i
-    return s
+            parts.append(f'{name}{star}')
+    return connection.join(parts)
 
 
 def get_venue_badge(booktitle, award=None):
@@ -140,6 +364,250 @@ def get_tag_html(tags_str):
     return html
 
 
+def save_image_variant(im, path, fmt):
+    """Save atomically, so parallel section renderers can share variants"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    if fmt == 'JPEG':
+        im.convert('RGB').save(tmp, fmt, quality=82, optimize=True, progressive=True)
+    elif fmt == 'PNG':
+        im.save(tmp, fmt, optimize=True)
+    elif fmt == 'WEBP':
+        im.save(tmp, fmt, quality=80, method=6)
+    else:
+        im.save(tmp, fmt, quality=50)
+    os.replace(tmp, path)
+
+
+def copy_shared_variant(path, publish=False):
+    """In batch builds, take a variant another site already rendered, or publish one for the others"""
+    if not build_options['shared_cache']:
+        return
+    shared = os.path.join(build_options['shared_cache'], 'variants', os.path.basename(path))
+    src, dst = (path, shared) if publish else (shared, path)
+    if os.path.exists(src) and not os.path.exists(dst):
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = f'{dst}.{os.getpid()}.tmp'
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+
+
+def get_image_variants(src):
+    """Resized 1x/2x copies of an image as {mime type: [(path, density)]}, cached by source hash.
+
+    Returns None if the pipeline is off, Pillow is missing or the image can't be resized
+    (e.g. animated GIFs), in which case the original is used as is.
+    """
+    if not build_options['responsive_images'] or Image is None or not os.path.isfile(src):
+        return None
+
+    fallback = 'PNG' if src.lower().endswith(('.png', '.gif')) else 'JPEG'
+    formats = [f for f in ('AVIF', 'WEBP') if features.check(f.lower())] + [fallback]
+    stem = os.path.splitext(os.path.basename(src))[0]
+    digest = hash_file(src)[:12]
+
+    variants = {}
+    im = None
+    for fmt in formats:
+        ext = 'jpg' if fmt == 'JPEG' else fmt.lower()
+        variants[f'image/{fmt.lower()}'] = paths = []
+        for density, width in enumerate(IMAGE_WIDTHS, 1):
+            path = f'{IMAGE_VARIANT_DIR}/{stem}-{digest}-{width}w.{ext}'
+            copy_shared_variant(path)
+            if not os.path.exists(path):
+                if im is None:
+                    try:
+                        im = Image.open(src)
+                        if getattr(im, 'is_animated', False):
+                            return None
+                        im = ImageOps.exif_transpose(im)
+                    except OSError:
+                        return None
+                if density > 1 and im.width <= IMAGE_WIDTHS[0]:
+                    break  # Source too small for a sharper variant
+                resized = im.resize((width, round(im.height * width / im.width)), Image.LANCZOS) \
+                    if im.width > width else im
+                save_image_variant(resized, path, fmt)
+                copy_shared_variant(path, publish=True)
+            paths.append((path, density))
+    return variants
+
+
+def is_animated_gif(path):
+    """True if a GIF has more than one frame (walks the block structure, no decoding)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:6] not in (b'GIF87a', b'GIF89a'):
+        return False
+
+    def skip_color_table(pos, flags):
+        return pos + (3 << ((flags & 7) + 1) if flags & 0x80 else 0)
+
+    pos = skip_color_table(13, data[10])
+    frames = 0
+    while pos < len(data):
+        if data[pos] == 0x2C:  # Image descriptor
+            frames += 1
+            if frames > 1:
+                return True
+            pos = skip_color_table(pos + 10, data[pos + 9]) + 1
+        elif data[pos] == 0x21:  # Extension
+            pos += 2
+        else:  # Trailer
+            break
+        while pos < len(data) and data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    return False
+
+
+def get_gif_video(src):
+    """Muted looping WebM/MP4 transcodes and a poster frame for an animated GIF, cached by source hash.
+
+    Returns None (keep the GIF) if the step is off, ffmpeg is missing or src is not an animated GIF.
+    """
+    if not build_options['gif_video'] or not src.lower().endswith('.gif') or not os.path.isfile(src):
+        return None
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None or not is_animated_gif(src):
+        return None
+
+    stem = f'{IMAGE_VARIANT_DIR}/{os.path.splitext(os.path.basename(src))[0]}-{hash_file(src)[:12]}'
+    even = ['-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2']
+    outputs = {
+        'webm': (f'{stem}.webm', even + ['-an', '-c:v', 'libvpx-vp9', '-b:v', '0', '-crf', '40']),
+        'mp4': (f'{stem}.mp4', even + ['-an', '-c:v', 'libx264', '-crf', '28', '-preset', 'slow',
+                                       '-pix_fmt', 'yuv420p', '-movflags', '+faststart']),
+        'poster': (f'{stem}-poster.jpg', ['-frames:v', '1', '-q:v', '3']),
+    }
+    os.makedirs(IMAGE_VARIANT_DIR, exist_ok=True)
+    for path, args in outputs.values():
+        if os.path.exists(path):
+            continue
+        base, ext = os.path.splitext(path)
+        tmp = f'{base}.{os.getpid()}.tmp{ext}'
+        try:
+            subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-i', src] + args + [tmp],
+                           check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            print(f'Could not transcode {src}: {e.stderr.decode(errors="replace").strip()}')
+            return None
+        os.replace(tmp, path)
+    return {kind: path for kind, (path, _) in outputs.items()}
+
+
+def read_image_size(data):
+    """(width, height) from PNG/GIF/WebP/JPEG header bytes, or None"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', data[6:10])
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        if data[12:16] == b'VP8 ':
+            w, h = struct.unpack('<HH', data[26:30])
+            return w & 0x3fff, h & 0x3fff
+        if data[12:16] == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+        if data[12:16] == b'VP8X':
+            return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+    if data[:2] == b'\xff\xd8':
+        pos = 2
+        while pos + 9 < len(data):
+            if data[pos] != 0xFF:
+                return None
+            marker = data[pos + 1]
+            if marker == 0xFF:  # Fill byte
+                pos += 1
+                continue
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):  # Start of frame
+                h, w = struct.unpack('>HH', data[pos + 5:pos + 9])
+                return w, h
+            pos += 2 + struct.unpack('>H', data[pos + 2:pos + 4])[0]
+    return None
+
+
+# Image sizes by content hash: all known in this process, and those measured since the last save_image_sizes()
+_image_sizes = {}
+_measured_sizes = {}
+
+
+def load_image_sizes():
+    try:
+        with open(os.path.join(get_cache_dir(), 'image_sizes.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_image_size(path):
+    """Intrinsic (width, height) of an image, cached per content hash in the build dir"""
+    digest = hash_file(path)
+    if digest is None:
+        return None
+    if not _image_sizes and build_options['cache']:
+        _image_sizes.update(load_image_sizes())
+    if digest not in _image_sizes:
+        with open(path, 'rb') as f:
+            _image_sizes[digest] = _measured_sizes[digest] = read_image_size(f.read())
+    return _image_sizes[digest]
+
+
+def add_measured_sizes(sizes):
+    """Take over image sizes measured by a worker process"""
+    _image_sizes.update(sizes)
+    _measured_sizes.update(sizes)
+
+
+def save_image_sizes():
+    """Merge the sizes measured so far into image_sizes.json, once per build.
+
+    Merging with the file as it is now keeps entries written meanwhile by other builds sharing the cache.
+    """
+    if not _measured_sizes or not build_options['cache']:
+        return
+    sizes = load_image_sizes()
+    sizes.update(_measured_sizes)
+    os.makedirs(get_cache_dir(), exist_ok=True)
+    cache_file = os.path.join(get_cache_dir(), 'image_sizes.json')
+    tmp = f'{cache_file}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(sizes, f)
+    os.replace(tmp, cache_file)
+    _measured_sizes.clear()
+
+
+def get_img_attrs(src, lazy=True):
+    """Intrinsic size to avoid layout shift, plus lazy loading or high fetch priority"""
+    size = get_image_size(src)
+    attrs = f' width="{size[0]}" height="{size[1]}"' if size else ''
+    return attrs + (' loading="lazy" decoding="async"' if lazy else ' fetchpriority="high"')
+
+
+def get_img_html(src, alt, lazy=True):
+    attrs = get_img_attrs(src, lazy)
+    video = get_gif_video(src)
+    if video:
+        return (f'<video autoplay muted loop playsinline poster="{video["poster"]}" aria-label="{alt}">'
+                f'<source src="{video["webm"]}" type="video/webm">'
+                f'<source src="{video["mp4"]}" type="video/mp4">'
+                f'<img src="{video["poster"]}" alt="{alt}"{attrs}></video>')
+
+    variants = get_image_variants(src)
+    if not variants:
+        return f'<img src="{src}" alt="{alt}"{attrs}>'
+
+    def srcset(paths):
+        return ', '.join(f'{path} {density}x' for path, density in paths)
+
+    *sources, (_, fallback) = variants.items()
+    source_html = ''.join(f'<source type="{mime}" srcset="{srcset(paths)}">' for mime, paths in sources)
+    return f'<picture>{source_html}<img src="{fallback[0][0]}" srcset="{srcset(fallback)}" alt="{alt}"{attrs}></picture>'
+
+
 def get_news_entry(entry):
     month_names = {
         1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr",
@@ -229,7 +697,7 @@ def get_paper_entry(entry_key, entry, paper_num=None):
     s = f'''
     <div class="publication-item" {paper_id_attr}>
         <div class="pub-image">
-            <img src="{img}" alt="{title}">
+            {get_img_html(img, title)}
         </div>
         <div class="pub-content">
             <div class="pub-title">
@@ -266,7 +734,7 @@ def get_talk_entry(entry_key, entry):
     return f'''
     <div class="talk-item">
         <div class="talk-image">
-            <img src="{img}" alt="{title}">
+            {get_img_html(img, title)}
         </div>
         <div class="talk-content">
             <div class="talk-title">{title}</div>
@@ -300,7 +768,7 @@ def get_award_entry(entry_key, entry):
     return f'''
     <div class="award-item">
         <div class="award-image">
-            <img src="{img}" alt="{title}">
+            {get_img_html(img, title)}
         </div>
         <div class="award-content">
             <div class="award-title">
@@ -314,86 +782,230 @@ def get_award_entry(entry_key, entry):
     '''
 
 
-def get_news_html():
-    with open('news_list.json', 'r') as f:
+def iter_news_html():
+    with open(get_input('news'), 'r') as f:
         news_entries = json.load(f)
 
     news_entries.sort(key=lambda e: (e.get("year", 0), e.get("month", 0)), reverse=True)
     
-    s = '<div class="news-list">'
+    yield '<div class="news-list">'
     for entry in news_entries[:8]:  # Show only recent 8 news items
-        s += get_news_entry(entry)
-    s += '</div>'
-    
-    return s
+        yield get_news_entry(entry)
+    yield '</div>'
+
+
+def get_news_html():
+    return ''.join(iter_news_html())
+
+
+def serialize_bib_entries(entries):
+    """Compact JSON-able form of parsed entries: [key, type, fields, {role: [name parts]}]"""
+    return [
+        [key, e.type, dict(e.fields),
+         {role: [[p.first_names, p.middle_names, p.prelast_names, p.last_names, p.lineage_names] for p in persons]
+          for role, persons in e.persons.items()}]
+        for key, e in entries.items()
+    ]
+
+
+def deserialize_bib_entries(data):
+    entries = {}
+    for key, type_, fields, persons in data:
+        roles = {}
+        for role, names in persons.items():
+            roles[role] = []
+            for first, middle, prelast, last, lineage in names:
+                p = Person()
+                p.first_names, p.middle_names, p.prelast_names, p.last_names, p.lineage_names = \
+                    first, middle, prelast, last, lineage
+                roles[role].append(p)
+        entries[key] = Entry(type_, fields=fields, persons=roles)
+    return entries
+
+
+def get_path_key(path):
+    """Short stable id of a file's absolute path, to name per-file cache entries"""
+    return hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:10]
+
+
+# Parsed bib entries by (absolute path, mtime, size), see clear_caches()
+_bibs = {}
+
+
+def load_bib(filename):
+    """Parsed entries of a .bib file, cached on disk keyed on mtime, size and content hash"""
+    st = os.stat(filename)
+    memo_key = (os.path.abspath(filename), st.st_mtime_ns, st.st_size)
+    if memo_key in _bibs:
+        return _bibs[memo_key]
+
+    cache_file = os.path.join(get_cache_dir(), 'bib', f'{os.path.basename(filename)}-{get_path_key(filename)}.json')
+    cached = None
+    if build_options['cache']:
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    meta = {'path': memo_key[0], 'mtime': st.st_mtime_ns, 'size': st.st_size, 'pybtex': pybtex.__version__}
+    if cached and all(cached['meta'].get(k) == v for k, v in meta.items()):
+        entries = deserialize_bib_entries(cached['entries'])
+    elif cached and cached['meta'].get('pybtex') == pybtex.__version__ and cached['meta'].get('sha256') == hash_file(filename):
+        # Touched but not modified: refresh the stat key only
+        entries = deserialize_bib_entries(cached['entries'])
+        cached['meta'].update(meta)
+        save_manifest(cached, cache_file)
+    else:
+        parser = bibtex.Parser()
+        entries = parser.parse_file(filename).entries
+        if build_options['cache']:
+            save_manifest({'meta': dict(meta, sha256=hash_file(filename)),
+                           'entries': serialize_bib_entries(entries)}, cache_file)
+
+    _bibs[memo_key] = entries
+    return entries
+
+
+def iter_papers_html(filename, start_num=1):
+    entries = load_bib(filename)
+    for i, k in enumerate(entries):
+        yield get_paper_entry(k, entries[k], paper_num=start_num + i)
+
+
+def iter_preprints_html(start_num=1):
+    return iter_papers_html(get_input('preprints'), start_num)
 
 
 def get_preprints_html(start_num=1):
-    parser = bibtex.Parser()
-    bib_data = parser.parse_file('preprint_list.bib')
-    keys = list(bib_data.entries.keys())
-    s = ""
-    for i, k in enumerate(keys):
-        s += get_paper_entry(k, bib_data.entries[k], paper_num=start_num + i)
-    return s, len(keys)
+    return ''.join(iter_preprints_html(start_num)), count_bib_entries(get_input('preprints'))
+
+
+def count_bib_entries(filename):
+    return len(load_bib(filename))
+
+
+def iter_publications_html(start_num=None):
+    if start_num is None:
+        start_num = count_bib_entries(get_input('preprints')) + 1
+    entries = iter_papers_html(get_input('publications'), start_num)
+    if build_options['paginate_publications']:
+        return iter_paginated_html(entries, build_options['paginate_publications'])
+    return entries
+
+
+def write_pub_chunk(html):
+    """Write a content-hashed chunk of publication entries, returning its path"""
+    path = f'{PUB_CHUNK_DIR}/pubs.{hashlib.sha256(html.encode()).hexdigest()[:10]}.html'
+    if not os.path.exists(path):
+        os.makedirs(PUB_CHUNK_DIR, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(html)
+    return path
+
+
+def iter_pub_chunks(html):
+    """Contents of the publication chunk files a page fetches later, for stages that need the whole markup"""
+    for path in re.findall(r'<div class="pub-chunk" data-src="([^"]+)"', html):
+        with open(path, 'r') as f:
+            yield f.read()
+
+
+def iter_paginated_html(entries, page_size):
+    """First page_size entries inline, the rest as placeholders for chunk files of page_size entries.
+
+    Each placeholder lists the pub- ids it holds, so a #pub-C4 link can load the right chunk.
+    """
+    entries = list(entries)
+    yield from entries[:page_size]
+    paths = []
+    for i in range(page_size, len(entries), page_size):
+        html = ''.join(entries[i:i + page_size])
+        # Page stages don't see chunks, so apply the ones that rewrite entry markup here
+        if build_options['fingerprint']:
+            html = fingerprint_html(html)
+        if get_minify_mode('index'):
+            html = minify_html(html, get_minify_mode('index'))
+        paths.append(write_pub_chunk(html))
+        refs = ' '.join(re.findall(r'id="pub-([^"]+)"', html))
+        yield f'\n    <div class="pub-chunk" data-src="{paths[-1]}" data-refs="{refs}"></div>'
+    if paths:
+        yield f'\n    <button type="button" class="pub-show-all">Show all {len(entries)} publications</button>'
+    if os.path.isdir(PUB_CHUNK_DIR):
+        for old in os.listdir(PUB_CHUNK_DIR):
+            if re.fullmatch(r'pubs\.[0-9a-f]{10}\.html', old) and f'{PUB_CHUNK_DIR}/{old}' not in paths:
+                remove_output(f'{PUB_CHUNK_DIR}/{old}')
 
 
 def get_publications_html(start_num=1):
-    parser = bibtex.Parser()
-    bib_data = parser.parse_file('publication_list.bib')
-    keys = list(bib_data.entries.keys())
-    s = ""
-    for i, k in enumerate(keys):
-        s += get_paper_entry(k, bib_data.entries[k], paper_num=start_num + i)
-    return s
+    return ''.join(iter_publications_html(start_num))
+
+
+def iter_talks_html():
+    entries = load_bib(get_input('talks'))
+    for k in entries:
+        yield get_talk_entry(k, entries[k])
 
 
 def get_talks_html():
-    parser = bibtex.Parser()
-    bib_data = parser.parse_file('talk_list.bib')
-    keys = bib_data.entries.keys()
-    s = ""
-    for k in keys:
-        s += get_talk_entry(k, bib_data.entries[k])
-    return s
+    return ''.join(iter_talks_html())
+
+
+def iter_awards_html():
+    entries = load_bib(get_input('awards'))
+    for k in entries:
+        yield get_award_entry(k, entries[k])
 
 
 def get_awards_html():
-    parser = bibtex.Parser()
-    bib_data = parser.parse_file('award_list.bib')
-    keys = bib_data.entries.keys()
-    s = ""
-    for k in keys:
-        s += get_award_entry(k, bib_data.entries[k])
-    return s
+    return ''.join(iter_awards_html())
 
 
-def get_blog_html():
+def parse_front_matter(text):
+    """Split '---' delimited 'key: value' front matter from a post's Markdown body"""
+    meta = {}
+    m = re.match(r'---\n(.*?)\n---\n', text, flags=re.S)
+    if m:
+        for line in m.group(1).splitlines():
+            key, _, value = line.partition(':')
+            if key.strip():
+                meta[key.strip()] = value.strip()
+        text = text[m.end():]
+    return meta, text
+
+
+def get_posts():
+    """Blog posts from POST_DIR, newest first"""
+    posts = []
+    for path in sorted(glob.glob(f'{POST_DIR}/*.md')):
+        with open(path, 'r') as f:
+            meta, body = parse_front_matter(f.read())
+        slug = os.path.splitext(os.path.basename(path))[0]
+        year, _, month = meta.get('date', '').partition('-')
+        month = int(month) if month.isdigit() and 1 <= int(month) <= 12 else 0
+        posts.append({
+            'slug': slug,
+            'source': path,
+            'url': f'{BLOG_DIR}/{slug}.html',
+            'title': meta.get('title', slug),
+            'year': year,
+            'month': month,
+            'date': f'{calendar.month_abbr[month]} {year}'.strip(),
+            'long_date': f'{calendar.month_name[month]} {year}'.strip(),
+            'excerpt': meta.get('excerpt', ''),
+            'listed': meta.get('listed', 'true').lower() != 'false',
+            'body': body,
+        })
+    posts.sort(key=lambda p: (p['year'], p['month']), reverse=True)
+    return posts
+
+
+def iter_blog_html():
     """Generate blog posts"""
-    posts = [
-        {
-            'title': 'Coming Soon',
-            'date': 'Jan 2026',
-            'excerpt': '...will be updated soon...',
-            'url': 'blog/dummy.html'
-        },
-        # {
-        #     'title': 'Safety and Privacy in Generative Models',
-        #     'date': 'Dec 2025',
-        #     'excerpt': 'Discussing key challenges and solutions for ensuring privacy and safety in large-scale generative models. Covering memorization, unlearning, and alignment techniques...',
-        #     'url': 'blog/safety-privacy-generative-models.html'
-        # },
-        # {
-        #     'title': 'Efficient Training Strategies for Large Models',
-        #     'date': 'Nov 2025',
-        #     'excerpt': 'An overview of quantization, low-rank adaptation, and other efficient training methods. We benchmark various approaches and discuss their trade-offs...',
-        #     'url': 'blog/efficient-training-strategies.html'
-        # }
-    ]
-    
-    s = ""
-    for post in posts:
-        s += f'''
+    for post in get_posts():
+        if not post['listed']:
+            continue
+        yield f'''
     <div class="blog-item">
         <div class="blog-meta">
             <span class="blog-date">{post['date']}</span>
@@ -405,7 +1017,395 @@ def get_blog_html():
         </div>
     </div>
     '''
-    return s
+
+
+def get_cached_block(cache, kind, source, render):
+    """Rendered html for a code/math block, cached by content hash across builds"""
+    key = hashlib.sha256(f'{kind}\0{source}'.encode()).hexdigest()
+    if key not in cache:
+        cache[key] = render()
+    return cache[key]
+
+
+def render_math(latex, display, cache, source=''):
+    """Static MathML for a LaTeX formula (escaped source if latex2mathml is missing or can't convert it)"""
+    formula = f'$${latex}$$' if display else f'${latex}$'
+    if latex_to_mathml is None:
+        return escape(formula)
+    try:
+        return get_cached_block(cache, f'math-{display}', latex,
+                                lambda: latex_to_mathml(latex, display='block' if display else 'inline'))
+    except Exception as e:  # latex2mathml's errors share no base class
+        print(f'Could not convert math in {source or "post"}, kept as LaTeX: {formula} ({type(e).__name__})')
+        return escape(formula)
+
+
+def extract_math(text):
+    """Replace $$..$$, \\[..\\], $..$ and \\(..\\) outside code with placeholders, before Markdown sees them.
+
+    Returns the text and {placeholder: (source, latex, display)}. Inline $..$ must not start or end
+    with a space nor be followed by a digit, so prices like $5 and $10 are left alone. Only fences and
+    code spans are skipped here; indented code blocks are only known after Markdown, see render_post_body.
+    """
+    found = {}
+
+    def replace(m, display):
+        placeholder = f'MATHPLACEHOLDER{len(found)}END'
+        found[placeholder] = m.group(0), (m.group(1) or m.group(2)).strip(), display
+        return placeholder
+
+    parts = re.split(r'(```.*?```|`[^`\n]*`)', text, flags=re.S)
+    for i in range(0, len(parts), 2):  # Odd parts are code spans and fences
+        parts[i] = re.sub(r'\$\$(.+?)\$\$|\\\[(.+?)\\\]',
+                          lambda m: replace(m, True), parts[i], flags=re.S)
+        parts[i] = re.sub(r'\$(?!\s)([^$\n]+?)(?<!\s)\$(?!\d)|\\\((.+?)\\\)',
+                          lambda m: replace(m, False), parts[i])
+    return ''.join(parts), found
+
+
+def highlight_code_blocks(html, cache):
+    """Pygments-highlight <pre><code class="language-x"> blocks at build time"""
+    if highlight is None:
+        return html
+
+    def replace(m):
+        try:
+            lexer = get_lexer_by_name(m.group(1))
+        except ClassNotFound:
+            return m.group(0)
+        code = unescape(m.group(2))
+        return get_cached_block(cache, f'code-{m.group(1)}', code, lambda: '<pre class="highlight"><code>' +
+                                highlight(code, lexer, HtmlFormatter(nowrap=True)) + '</code></pre>')
+
+    return re.sub(r'<pre><code class="language-([\w+#-]+)">(.*?)</code></pre>', replace, html, flags=re.S)
+
+
+def get_highlight_css():
+    """Token colors for highlighted code blocks"""
+    return HtmlFormatter().get_style_defs('.post-content .highlight') + '\n' if highlight else ''
+
+
+def render_post_body(body, cache, source=''):
+    """Markdown to html with math pre-rendered to MathML and code pre-highlighted"""
+    body, math = extract_math(body)
+    html = markdown.markdown(body, extensions=['fenced_code', 'tables'])
+    # Placeholders that ended up in code (e.g. indented code blocks) get their source text back
+    html = re.sub(r'<(pre|code)\b.*?</\1>', lambda m: re.sub(
+        r'MATHPLACEHOLDER\d+END', lambda p: escape(math[p.group(0)][0], quote=False), m.group(0)), html, flags=re.S)
+    for placeholder, (_, latex, display) in math.items():
+        if placeholder in html:
+            rendered = render_math(latex, display, cache, source)
+            html = html.replace(f'<p>{placeholder}</p>', rendered).replace(placeholder, rendered)
+    return highlight_code_blocks(html, cache)
+
+
+def get_blog_post_html(post, stylesheet, cache=None):
+    """Full page for one blog post through the shared layout"""
+    data = get_personal_data()
+    name = f"{data['name'][0]} {data['name'][1]}"
+    content = render_post_body(post['body'], {} if cache is None else cache, post['source'])
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{post['title']} - {name}</title>
+    <link rel="icon" type="image/x-icon" href="../favicon.ico">
+    <link rel="stylesheet" href="../{stylesheet}">
+</head>
+<body>
+    <!-- Navigation -->
+    <nav class="navbar">
+        <div class="nav-container">
+            <a href="../index.html" class="nav-brand">{name}</a>
+            <div class="nav-links">
+                <a href="../index.html#about">About</a>
+                <a href="../index.html#publications">Publications</a>
+                <a href="../index.html#awards">Awards</a>
+                <a href="../index.html#blog">Blog</a>
+            </div>
+        </div>
+    </nav>
+    
+    <div class="container">
+        <article class="blog-post">
+            <a href="../index.html#blog" class="back-link">← Back to blog</a>
+            
+            <div class="post-header">
+                <h1 class="post-title">{post['title']}</h1>
+                <div class="post-meta">Published on {post['long_date']}</div>
+            </div>
+            
+            <div class="post-content">
+{content}
+            </div>
+        </article>
+    </div>
+    
+    <footer class="footer">
+        <p>© 2026 {name}.</p>
+    </footer>
+</body>
+</html>
+'''
+
+
+def write_blog_pages():
+    """Render posts/*.md into blog/<slug>.html, skipping posts whose source and settings are unchanged
+
+    Pages this function wrote earlier (recorded in BUILD_DIR/blog.json) whose post was deleted or
+    renamed are removed; other files in BLOG_DIR are left alone.
+    """
+    posts = get_posts()
+    state_file = os.path.join(BUILD_DIR, 'blog.json')
+    state = load_manifest(state_file)
+    orphans = sorted(set(state) - {post['url'] for post in posts})
+    for path in orphans:
+        remove_output(path)
+        del state[path]
+    if orphans:
+        print(f'Blog: removed {len(orphans)} page(s) without a post ({", ".join(orphans)}).')
+        save_manifest(state, state_file)
+    if not posts:
+        return
+    if markdown is None:
+        print(f'markdown is not installed, blog pages in {BLOG_DIR}/ were not rebuilt.')
+        return
+
+    os.makedirs(BLOG_DIR, exist_ok=True)
+    stylesheet = write_shared_stylesheet(get_shared_css())
+    blocks_file = os.path.join(get_cache_dir(), 'blog_blocks.json')
+    blocks = load_manifest(blocks_file) if build_options['cache'] else {}
+    mode = get_minify_mode('blog')
+    rendered = []
+    for post in posts:
+        filename = f'{BLOG_DIR}/{post["slug"]}.html'
+        stamp = [hash_file(post['source']), hash_file(__file__), stylesheet, mode, build_options['fingerprint'],
+                 build_options['personal'], highlight is not None, latex_to_mathml is not None]
+        if build_options['cache'] and state.get(filename) == stamp + [hash_file(filename)]:
+            continue
+        html = get_blog_post_html(post, stylesheet, blocks)
+        if build_options['fingerprint']:
+            html = fingerprint_html(html, root='../')
+        if mode:
+            html = minify_html(html, mode)
+        write_chunks(filename, [html])
+        state[filename] = stamp + [hash_file(filename)]
+        rendered.append(post['slug'])
+
+    save_manifest(state, state_file)  # Even with --no-cache, as it records which pages are ours to remove
+    if build_options['cache']:
+        save_manifest(blocks, blocks_file)
+    print(f'Blog: rendered {len(rendered)}/{len(posts)} posts' + (f' ({", ".join(rendered)})' if rendered else '') + '.')
+
+
+def get_blog_html():
+    return ''.join(iter_blog_html())
+
+
+def get_search_tokens(text):
+    """Lowercased words of html/LaTeX-ish text, minus stop words and single characters"""
+    words = re.findall(r'[^\W_]+', unescape(re.sub(r'<[^>]+>', ' ', text)).lower())
+    return [w for w in words if len(w) > 1 and w not in SEARCH_STOP_WORDS]
+
+
+def iter_search_docs():
+    """(title, url, meta, text) for every paper and listed blog post, papers numbered as on the page"""
+    num = 1
+    for filename in (get_input('preprints'), get_input('publications')):
+        for entry in load_bib(filename).values():
+            fields = entry.fields
+            title = re.sub(r'[{}]', '', fields.get('title', ''))
+            authors = generate_person_html(entry.persons['author'], '', make_bold=False, add_links=False)
+            venue = f"{fields.get('booktitle', '')}, {fields.get('year', '')}".strip(', ')
+            text = ' '.join([title, authors, venue, fields.get('tldr', ''), fields.get('prev_booktitle', '')])
+            yield title, f"#pub-{fields.get('pub_id') or num}", venue, text
+            num += 1
+    for post in get_posts():
+        if post['listed']:
+            yield post['title'], post['url'], f"Blog, {post['date']}", \
+                ' '.join([post['title'], post['excerpt'], post['body']])
+
+
+def get_search_index():
+    """Inverted index: {'docs': [[title, url, meta]], 'terms': {term: [doc numbers]}, 'stop_words': [...]}
+
+    The stop words are shipped so the client drops the same query words the index left out.
+    """
+    docs, terms = [], {}
+    for i, (title, url, meta, text) in enumerate(iter_search_docs()):
+        docs.append([title, url, meta])
+        for term in dict.fromkeys(get_search_tokens(text)):
+            terms.setdefault(term, []).append(i)
+    return {'docs': docs, 'terms': dict(sorted(terms.items())), 'stop_words': sorted(SEARCH_STOP_WORDS)}
+
+
+def write_search_index():
+    """Write the content-hashed search index, returning its path"""
+    data = json.dumps(get_search_index(), separators=(',', ':'))
+    path = f'{SEARCH_DIR}/index.{hashlib.sha256(data.encode()).hexdigest()[:10]}.json'
+    os.makedirs(SEARCH_DIR, exist_ok=True)
+    if not os.path.exists(path):
+        with open(path, 'w') as f:
+            f.write(data)
+    for old in os.listdir(SEARCH_DIR):
+        if re.fullmatch(r'index\.[0-9a-f]{10}\.json', old) and f'{SEARCH_DIR}/{old}' != path:
+            remove_output(f'{SEARCH_DIR}/{old}')
+    return path
+
+
+def get_search_html():
+    """Navbar search box; the index is only fetched once it gets focus"""
+    return f'''
+            <div class="nav-search">
+                <input type="search" id="search-input" placeholder="Search" aria-label="Search publications and posts"
+                       autocomplete="off" data-index="{write_search_index()}">
+                <div id="search-results" class="search-results" hidden></div>
+            </div>'''
+
+
+def get_search_js():
+    return '''
+        // Search: fetch the prebuilt index on first focus, then match word prefixes locally
+        const searchInput = document.getElementById('search-input');
+        const searchResults = document.getElementById('search-results');
+        let searchIndex = null;
+        
+        function loadSearchIndex() {
+            if (!searchIndex) {
+                searchIndex = fetch(searchInput.dataset.index)
+                    .then(response => response.json())
+                    .then(index => ({ ...index, termList: Object.keys(index.terms), stopWords: new Set(index.stop_words) }));
+            }
+            return searchIndex;
+        }
+        
+        function searchTokens(text) {
+            return text.toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || [];
+        }
+        
+        async function runSearch() {
+            const query = searchInput.value;
+            if (!searchTokens(query).length) {
+                searchResults.hidden = true;
+                return;
+            }
+            const index = await loadSearchIndex();
+            if (searchInput.value !== query) return;
+            // Same words as the index: no stop words or single characters
+            const tokens = searchTokens(query).filter(token => token.length > 1 && !index.stopWords.has(token));
+            if (!tokens.length) {
+                searchResults.hidden = true;
+                return;
+            }
+            // Every query word must match (exact words score higher than prefixes, title words higher still)
+            let scores = null;
+            tokens.forEach(token => {
+                const hits = new Map();
+                index.termList.filter(term => term.startsWith(token)).forEach(term => {
+                    index.terms[term].forEach(doc => hits.set(doc, Math.max(hits.get(doc) || 0, term === token ? 2 : 1)));
+                });
+                hits.forEach((score, doc) => {
+                    if (searchTokens(index.docs[doc][0]).some(word => word.startsWith(token))) hits.set(doc, score + 2);
+                });
+                scores = scores === null ? hits : new Map([...scores]
+                    .filter(([doc]) => hits.has(doc))
+                    .map(([doc, score]) => [doc, score + hits.get(doc)]));
+            });
+            const ranked = [...scores].sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, 8);
+            searchResults.replaceChildren(...ranked.map(([doc]) => {
+                const [title, url, meta] = index.docs[doc];
+                const link = document.createElement('a');
+                link.href = url;
+                link.className = 'search-result';
+                link.append(Object.assign(document.createElement('span'), { className: 'search-title', textContent: title }),
+                            Object.assign(document.createElement('span'), { className: 'search-meta', textContent: meta }));
+                return link;
+            }));
+            if (!ranked.length) {
+                searchResults.append(Object.assign(document.createElement('span'), { className: 'search-meta', textContent: 'No results' }));
+            }
+            searchResults.hidden = false;
+        }
+        
+        searchInput.addEventListener('focus', loadSearchIndex, { once: true });
+        searchInput.addEventListener('input', runSearch);
+        searchInput.addEventListener('keydown', e => {
+            const first = searchResults.querySelector('a');
+            if (e.key === 'Enter' && first) first.click();
+            if (e.key === 'Escape' || e.key === 'Enter') searchResults.hidden = true;
+        });
+        searchResults.addEventListener('click', () => { searchResults.hidden = true; });
+        document.addEventListener('click', e => {
+            if (!e.target.closest('.nav-search')) searchResults.hidden = true;
+        });
+'''
+
+
+def get_pagination_js():
+    return '''
+        // Paginated publications: later entries are fetched chunk by chunk as the list is scrolled
+        // to its end, all at once on "show all", and up to the one holding a #pub- link's target
+        const pubChunks = Array.from(document.querySelectorAll('.pub-chunk'));
+        const pubShowAll = document.querySelector('.pub-show-all');
+        
+        function loadPubChunk(chunk) {
+            if (!chunk.loaded) {
+                chunk.loaded = fetch(chunk.dataset.src)
+                    .then(response => response.text())
+                    .then(html => {
+                        chunk.insertAdjacentHTML('beforebegin', html);
+                        chunk.remove();
+                        if (pubChunks.every(chunk => !chunk.isConnected)) pubShowAll.remove();
+                    });
+            }
+            return chunk.loaded;
+        }
+        
+        function loadPubChunks(count) {
+            return Promise.all(pubChunks.slice(0, count).map(loadPubChunk));
+        }
+        
+        async function showPub(hash, smooth) {
+            const ref = hash.slice('#pub-'.length);
+            const index = pubChunks.findIndex(chunk => chunk.dataset.refs.split(' ').includes(ref));
+            if (index < 0) return;
+            await loadPubChunks(index + 1);
+            const target = document.getElementById(hash.slice(1));
+            if (target) target.scrollIntoView({ behavior: smooth ? 'smooth' : 'auto', block: 'start' });
+        }
+        
+        function isUnloadedPub(hash) {
+            return hash.startsWith('#pub-') && !document.getElementById(hash.slice(1));
+        }
+        
+        if (pubChunks.length) {
+            pubShowAll.addEventListener('click', () => loadPubChunks(pubChunks.length));
+            if ('IntersectionObserver' in window) {
+                const chunkObserver = new IntersectionObserver(entries => {
+                    if (!entries.some(entry => entry.isIntersecting)) return;
+                    chunkObserver.disconnect();
+                    const next = pubChunks.find(chunk => !chunk.loaded);
+                    if (next) loadPubChunk(next).then(() => chunkObserver.observe(pubShowAll));
+                }, { rootMargin: '600px 0px' });
+                chunkObserver.observe(pubShowAll);
+            }
+            // Links to entries that are not loaded yet (bio citations, search results), before the
+            // smooth scrolling handler gives up on them
+            document.addEventListener('click', e => {
+                const link = e.target.closest('a[href^="#pub-"]');
+                if (!link || !isUnloadedPub(link.getAttribute('href'))) return;
+                e.preventDefault();
+                e.stopPropagation();
+                history.pushState(null, null, link.getAttribute('href'));
+                showPub(link.getAttribute('href'), true);
+            }, true);
+            window.addEventListener('hashchange', () => {
+                if (isUnloadedPub(location.hash)) showPub(location.hash, true);
+            });
+            if (isUnloadedPub(location.hash)) showPub(location.hash, false);
+        }
+'''
 
 
 def get_css():
@@ -544,9 +1544,17 @@ def get_css():
         text-decoration: underline;
     }
     
-    .social-link i {
+    .social-link i,
+    .social-link .icon {
         margin-right: 0.25rem;
     }
+    .icon {
+        display: inline-block;
+        height: 1em;
+        vertical-align: -0.125em;
+        fill: currentColor;
+        overflow: visible;
+    }
     
     /* Bio Section */
     .bio-section {
@@ -647,7 +1655,8 @@ def get_css():
         border-bottom: none;
     }
 
-    .pub-image img {
+    .pub-image img,
+    .pub-image video {
         width: 180px;
         height: auto;
         border: 1px solid #ccc;
@@ -952,6 +1961,7 @@ def get_css():
         }
         
         .pub-image img,
+        .pub-image video,
         .talk-image img,
         .award-image img {
             width: 100%;
@@ -971,17 +1981,664 @@ def get_css():
     '''
 
 
-def get_index_html():
-    data = get_personal_data()
-    news = get_news_html()
-    prep, prep_count = get_preprints_html(start_num=1)
-    pub = get_publications_html(start_num=prep_count + 1)
-    talks = get_talks_html()
-    awards = get_awards_html()
-    blog = get_blog_html()
+def get_search_css():
+    """Rules for the navbar search box, added to get_css() with --search"""
+    return '''
+    .nav-search {
+        position: relative;
+        margin: 0 1.25rem 0 auto;
+    }
+    .nav-search input {
+        width: 12rem;
+        padding: 0.2rem 0.5rem;
+        border: 1px solid var(--border);
+        border-radius: 4px;
+        font: inherit;
+        font-size: 0.85rem;
+    }
+    .search-results {
+        position: absolute;
+        right: 0;
+        top: calc(100% + 0.4rem);
+        width: 22rem;
+        max-width: 90vw;
+        max-height: 60vh;
+        overflow-y: auto;
+        background: var(--white);
+        border: 1px solid var(--border);
+        border-radius: 4px;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+    }
+    .search-results[hidden] {
+        display: none;
+    }
+    .search-result {
+        display: block;
+        padding: 0.4rem 0.6rem;
+        border-bottom: 1px solid var(--border);
+    }
+    .search-result:last-child {
+        border-bottom: none;
+    }
+    .search-result:hover {
+        background: var(--light-bg);
+    }
+    .search-title {
+        display: block;
+        font-size: 0.85rem;
+    }
+    .search-meta {
+        display: block;
+        padding: 0 0.1rem;
+        color: var(--muted);
+        font-size: 0.75rem;
+    }
+    @media (max-width: 768px) {
+        .nav-search input {
+            width: 7rem;
+        }
+    }
+    '''
+
+
+def get_pagination_css():
+    """Rules for the "show all" button, added to get_css() with --paginate-publications"""
+    return '''
+    .pub-show-all {
+        display: block;
+        margin: 1rem auto 0;
+        padding: 0.3rem 0.9rem;
+        background: none;
+        border: 1px solid var(--border);
+        border-radius: 4px;
+        color: var(--accent);
+        font: inherit;
+        font-size: 0.85rem;
+        cursor: pointer;
+    }
+    .pub-show-all:hover {
+        color: var(--accent-hover);
+        background: var(--light-bg);
+    }
+    '''
+
+
+def get_page_css():
+    """Index page stylesheet: get_css() plus the rules of enabled optional widgets"""
     css = get_css()
-    
-    s = f'''<!DOCTYPE html>
+    if build_options['search']:
+        css += get_search_css()
+    if build_options['paginate_publications']:
+        css += get_pagination_css()
+    return css
+
+
+def get_blog_css():
+    """Rules only the blog post pages use, on top of get_css()"""
+    return '''
+    .blog-post {
+        margin-top: 3rem;
+        margin-bottom: 3rem;
+        max-width: 850px;
+    }
+    .post-header {
+        margin-bottom: 2rem;
+        border-bottom: 1px solid var(--border);
+        padding-bottom: 1.5rem;
+    }
+    .post-title {
+        font-size: 2rem;
+        font-weight: 600;
+        margin-bottom: 0.5rem;
+        color: var(--primary);
+    }
+    .post-meta {
+        font-size: 0.9rem;
+        color: var(--muted);
+    }
+    .post-content {
+        font-size: 0.95rem;
+        line-height: 1.8;
+        color: #333;
+    }
+    .post-content h2 {
+        font-size: 1.3rem;
+        font-weight: 600;
+        margin-top: 1.5rem;
+        margin-bottom: 0.75rem;
+        color: var(--primary);
+    }
+    .post-content h3 {
+        font-size: 1.1rem;
+        font-weight: 600;
+        margin-top: 1rem;
+        margin-bottom: 0.5rem;
+        color: var(--primary);
+    }
+    .post-content p {
+        margin-bottom: 1rem;
+    }
+    .post-content ul {
+        margin-left: 1.5rem;
+        margin-bottom: 1rem;
+    }
+    .post-content li {
+        margin-bottom: 0.5rem;
+    }
+    .post-content code {
+        background: var(--light-bg);
+        padding: 0.2rem 0.4rem;
+        border-radius: 3px;
+        font-family: monospace;
+        font-size: 0.9em;
+    }
+    .post-content pre {
+        background: var(--light-bg);
+        padding: 1rem;
+        border-radius: 5px;
+        overflow-x: auto;
+        margin-bottom: 1rem;
+    }
+    .post-content pre code {
+        background: none;
+        padding: 0;
+    }
+    .back-link {
+        display: inline-block;
+        margin-bottom: 1rem;
+        font-size: 0.9rem;
+    }
+    '''
+
+
+def parse_css(css):
+    """Stylesheet as a list of (prelude, body) rules.
+
+    body is the declaration string, a nested rule list for @media-like blocks,
+    or None for statements such as @import.
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    return parse_css_block(css, 0)[0]
+
+
+def parse_css_block(css, pos):
+    rules = []
+    start = pos
+    while pos < len(css):
+        c = css[pos]
+        if c in '"\'':
+            pos = css.index(c, pos + 1) + 1
+        elif c == '{':
+            prelude = ' '.join(css[start:pos].split())
+            if prelude.startswith('@') and not prelude.startswith(('@font-face', '@page', '@property')):
+                body, pos = parse_css_block(css, pos + 1)
+            else:
+                end = css.index('}', pos)
+                body, pos = css[pos + 1:end].strip(), end + 1
+            rules.append((prelude, body))
+            start = pos
+        elif c == ';' and css[start:pos].strip().startswith('@'):
+            rules.append((' '.join(css[start:pos].split()), None))
+            start = pos = pos + 1
+        elif c == '}':
+            return rules, pos + 1
+        else:
+            pos += 1
+    return rules, pos
+
+
+def minify_css_text(text, punctuation):
+    """Collapse whitespace outside strings and drop it around the given punctuation"""
+    strings = r'("[^"]*"|\'[^\']*\')'
+    text = re.sub(strings + r'|\s+', lambda m: m.group(1) or ' ', text.strip())
+    return re.sub(strings + rf'|\s*([{punctuation}])\s*', lambda m: m.group(1) or m.group(2), text)
+
+
+def serialize_css(rules):
+    """Minified stylesheet text for parsed rules"""
+    out = []
+    for prelude, body in rules:
+        if body is None:
+            out.append(prelude + ';')
+        elif isinstance(body, list):
+            inner = serialize_css(body)
+            if inner or not prelude.startswith(('@media', '@supports', '@container', '@layer')):
+                out.append(f'{minify_css_text(prelude, ":,")}{{{inner}}}')
+        else:
+            out.append(f'{minify_css_text(prelude, ",>")}{{{minify_css_text(body, ":;,").rstrip(";")}}}')
+    return ''.join(out)
+
+
+def get_html_names(html):
+    """Tag names, classes and ids a page uses; class/id-like words in its scripts count too"""
+    html = re.sub(r'<style\b.*?</style>', '', html, flags=re.S)
+    tags = {t.lower() for t in re.findall(r'<([a-zA-Z][\w-]*)', html)}
+    classes = {c for value in re.findall(r'class="([^"]*)"', html) for c in value.split()}
+    ids = set(re.findall(r'id="([^"]*)"', html))
+    for script in re.findall(r'<script\b[^>]*>(.*?)</script>', html, flags=re.S):
+        words = set(re.findall(r'[\w-]+', script))
+        classes |= words
+        ids |= words
+    return tags, classes, ids
+
+
+def is_selector_used(selector, names):
+    """Conservative match: every tag, class and id in the selector occurs in the page"""
+    tags, classes, ids = names
+    selector = re.sub(r'::?[\w-]+(\([^)]*\))?|\[[^\]]*\]', '', selector)
+    for prefix, name in re.findall(r'([.#]?)(-?[_a-zA-Z][\w-]*)', selector):
+        if name not in {'.': classes, '#': ids, '': tags}[prefix] and (prefix or name.lower() not in tags):
+            return False
+    return True
+
+
+def prune_css(rules, names):
+    """Drop selectors (and then rules) that match nothing in the page; returns (rules, dropped count)"""
+    pruned, dropped = [], 0
+    for prelude, body in rules:
+        if isinstance(body, list):
+            if prelude.startswith(('@media', '@supports', '@container', '@layer')):
+                body, n = prune_css(body, names)
+                dropped += n
+        elif body is not None and not prelude.startswith('@'):
+            selectors = [sel for sel in prelude.split(',') if is_selector_used(sel.strip(), names)]
+            if not selectors:
+                dropped += 1
+                continue
+            prelude = ','.join(selectors)
+        pruned.append((prelude, body))
+    return pruned, dropped
+
+
+def minify_page_css(html):
+    """Post-render stage: prune unused rules from and minify the page's <style> blocks"""
+    names = get_html_names(html + ''.join(iter_pub_chunks(html)))
+    saved = dropped = 0
+
+    def optimize(m):
+        nonlocal saved, dropped
+        rules, n = prune_css(parse_css(m.group(2)), names)
+        css = serialize_css(rules)
+        saved += len(m.group(2).encode()) - len(css.encode())
+        dropped += n
+        return m.group(1) + css + m.group(3)
+
+    html = re.sub(r'(<style\b[^>]*>)(.*?)(</style>)', optimize, html, flags=re.S)
+    print(f'CSS: dropped {dropped} unused rules, saved {saved} bytes.')
+    return html
+
+
+def split_critical_css(rules, names):
+    """Rules matching the above-the-fold names, keeping @media wrappers and @font-face/@import"""
+    critical = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            if prelude.startswith(('@media', '@supports', '@container', '@layer')):
+                inner = split_critical_css(body, names)
+                if inner:
+                    critical.append((prelude, inner))
+        elif body is None or prelude.startswith('@') or \
+                any(is_selector_used(sel.strip(), names) for sel in prelude.split(',')):
+            critical.append((prelude, body))
+    return critical
+
+
+def write_shared_stylesheet(css):
+    """Write the content-hashed stylesheet shared by index.html and the blog pages, returning its path"""
+    path = f'{CSS_DIR}/site.{hashlib.sha256(css.encode()).hexdigest()[:10]}.css'
+    os.makedirs(CSS_DIR, exist_ok=True)
+    if not os.path.exists(path):
+        with open(path, 'w') as f:
+            f.write(css)
+    for old in os.listdir(CSS_DIR):
+        if re.fullmatch(r'site\.[0-9a-f]{10}\.css', old) and f'{CSS_DIR}/{old}' != path:
+            remove_output(f'{CSS_DIR}/{old}')
+    return path
+
+
+def get_shared_css():
+    """Stylesheet shared by the blog pages and, with --critical-css, index.html (so with its widgets' rules)"""
+    css = get_page_css().strip() + '\n' + get_blog_css().strip() + '\n' + get_highlight_css()
+    return serialize_css(parse_css(css)) if build_options['minify_css'] else css
+
+
+def extract_critical_css(html):
+    """Post-render stage: inline only the navbar/profile rules, defer the full shared stylesheet"""
+    m = re.search(r'<style>(.*?)</style>', html, flags=re.S)
+    rules = parse_css(m.group(1))
+    fold = get_html_names(html[:html.index('</section>')])
+    critical = serialize_css(split_critical_css(rules, fold))
+
+    path = write_shared_stylesheet(get_shared_css())
+    print(f'Critical CSS: {len(critical.encode())} bytes inlined, rest deferred to {path}.')
+    head = (f'<style>{critical}</style>\n'
+            f'    <link rel="preload" href="{path}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{path}"></noscript>')
+    return html[:m.start()] + head + html[m.end():]
+
+
+def inline_icon_sprite(html):
+    """Post-render stage: swap Font Awesome <i> icons for <use> references into an inline SVG sprite.
+
+    Icons come from the local set in ICON_DIR; the CDN stylesheet is dropped once none are left.
+    """
+    styles = {'fa-solid': 'solid', 'fas': 'solid', 'fa-regular': 'regular', 'far': 'regular',
+              'fa-brands': 'brands', 'fab': 'brands'}
+    symbols = {}
+
+    def replace(m):
+        classes = m.group(1).split()
+        style = next((styles[c] for c in classes if c in styles), 'solid')
+        name = next((c[3:] for c in classes if c.startswith('fa-') and c not in styles), None)
+        path = f'{ICON_DIR}/{style}/{name}.svg'
+        if name is None or not os.path.isfile(path):
+            return m.group(0)
+        symbol_id = f'icon-{style}-{name}'
+        if symbol_id not in symbols:
+            with open(path, 'r') as f:
+                svg = re.sub(r'<!--.*?-->', '', f.read(), flags=re.S)
+            view_box = re.search(r'viewBox="([^"]*)"', svg).group(1)
+            inner = re.search(r'<svg\b[^>]*>(.*)</svg>', svg, flags=re.S).group(1).strip()
+            symbols[symbol_id] = f'<symbol id="{symbol_id}" viewBox="{view_box}">{inner}</symbol>'
+        return f'<svg class="icon" aria-hidden="true"><use href="#{symbol_id}"></use></svg>'
+
+    html = re.sub(r'<i class="([^"]*\bfa-[^"]*)"></i>', replace, html)
+    if not symbols:
+        return html
+    sprite = f'<svg xmlns="http://www.w3.org/2000/svg" style="display: none;">{"".join(symbols.values())}</svg>'
+    html = re.sub(r'<body>\n?', lambda m: m.group(0) + '    ' + sprite + '\n', html, count=1)
+    if not re.search(r'<i class="[^"]*\bfa-', html):
+        html = re.sub(r'<!-- Font Awesome -->\s*<link rel="stylesheet" href="[^"]*font-awesome[^"]*">\s*', '', html)
+    print(f'Icons: {len(symbols)} inlined as an SVG sprite ({len(sprite.encode())} bytes).')
+    return html
+
+
+def get_minify_mode(output):
+    return build_options['minify_html'].get(output, build_options['minify_html'].get('*'))
+
+
+def minify_html(html, mode='safe'):
+    """Strip comments and collapse whitespace, leaving <pre>, <textarea>, <script> and <style> verbatim.
+
+    'safe' collapses each whitespace run to one space (or newline), which never changes rendering;
+    'aggressive' also drops whitespace next to block-level tags.
+    """
+    preserved = []
+
+    def preserve(m):
+        preserved.append(m.group(0))
+        return f'\x00{len(preserved) - 1}\x00'
+
+    html = re.sub(r'<(pre|textarea|script|style)\b.*?</\1>', preserve, html, flags=re.S | re.I)
+    html = re.sub(r'<!--(?!\[if).*?-->', '', html, flags=re.S)
+    html = re.sub(r'\s+', lambda m: '\n' if '\n' in m.group(0) else ' ', html)
+    if mode == 'aggressive':
+        blocks = 'html|head|body|title|meta|link|nav|section|article|header|footer|main|div|p|ul|ol|li|h[1-6]|br'
+        html = re.sub(rf'\s*(</?(?:{blocks})\b[^>]*>)\s*', r'\1', html, flags=re.I)
+        html = re.sub(r'\s*(\x00\d+\x00)\s*', r'\1', html)
+    return re.sub(r'\x00(\d+)\x00', lambda m: preserved[int(m.group(1))], html).strip() + '\n'
+
+
+def minify_index_html(html):
+    """Post-render stage: minify index.html in its configured mode, reporting the savings"""
+    mode = get_minify_mode('index')
+    minified = minify_html(html, mode)
+    print(f'HTML ({mode}): {len(html.encode())} -> {len(minified.encode())} bytes.')
+    return minified
+
+
+def fingerprint_asset(path):
+    """Copy an asset to a content-hashed name under FINGERPRINT_DIR, returning the new path"""
+    base, ext = os.path.splitext(os.path.relpath(path, 'assets'))
+    target = f'{FINGERPRINT_DIR}/{base}.{hash_file(path)[:10]}{ext}'
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(path, target)
+    return target
+
+
+def get_immutable_dirs():
+    """Directories whose files already carry a content hash in their name"""
+    return [FINGERPRINT_DIR, CSS_DIR, FONT_DIR, IMAGE_VARIANT_DIR, SEARCH_DIR, PUB_CHUNK_DIR]
+
+
+def write_cache_headers(manifest):
+    with open(ASSET_MANIFEST, 'w') as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+    rules = [f'/{d}/*\n  Cache-Control: public, max-age=31536000, immutable\n' for d in get_immutable_dirs()]
+    rules.append('/*.html\n  Cache-Control: public, max-age=0, must-revalidate\n')
+    with open(HEADERS_FILE, 'w') as f:
+        f.write('\n'.join(rules))
+
+
+def fingerprint_html(html, root=''):
+    """Rewrite local asset references (src, href, srcset, poster) to fingerprinted copies.
+
+    root is the page's path back to the site root, e.g. '../' for blog pages.
+    """
+    manifest = load_manifest(ASSET_MANIFEST)
+    immutable = tuple(d + '/' for d in get_immutable_dirs())
+
+    def rewrite(url):
+        path = url[len(root):] if url.startswith(root) else None
+        if not path or not path.startswith('assets/') or path.startswith(immutable) or not os.path.isfile(path):
+            return url
+        manifest[path] = fingerprint_asset(path)
+        return root + manifest[path]
+
+    def replace(m):
+        if m.group(1) == 'srcset':
+            value = ', '.join(' '.join([rewrite(url)] + rest) for url, *rest in
+                              (candidate.split() for candidate in m.group(2).split(',')))
+        else:
+            value = rewrite(m.group(2))
+        return f'{m.group(1)}="{value}"'
+
+    html = re.sub(r'\b(src|href|srcset|poster)="([^"]*)"', replace, html)
+    write_cache_headers(manifest)
+    return html
+
+
+def fingerprint_index_html(html):
+    """Post-render stage: point index.html at fingerprinted assets"""
+    html = fingerprint_html(html)
+    print(f'Fingerprinted assets listed in {ASSET_MANIFEST}, cache rules in {HEADERS_FILE}.')
+    return html
+
+
+def get_page_text(html):
+    """Visible text of a page (what self-hosted fonts must cover)"""
+    html = re.sub(r'<(script|style)\b.*?</\1>', ' ', html, flags=re.S)
+    return unescape(re.sub(r'<[^>]+>', ' ', html))
+
+
+def subset_font(src, codepoints):
+    """WOFF2 subset of a font covering codepoints, cached by source hash and glyph set"""
+    key = hashlib.sha256(f'{hash_file(src)}:{sorted(codepoints)}'.encode()).hexdigest()[:10]
+    path = f'{FONT_DIR}/{os.path.splitext(os.path.basename(src))[0]}.{key}.woff2'
+    if not os.path.exists(path):
+        options = font_subset.Options()
+        options.flavor = 'woff2'
+        font = font_subset.load_font(src, options)
+        subsetter = font_subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        os.makedirs(FONT_DIR, exist_ok=True)
+        font_subset.save_font(font, path, options)
+    return path
+
+
+def self_host_fonts(html):
+    """Post-render stage: replace the Google Fonts link with WOFF2 subsets of local fonts.
+
+    Only families the stylesheet actually names are kept; unreferenced ones are dropped outright.
+    """
+    css = get_css() + get_blog_css()
+    codepoints = set(map(ord, get_page_text(html))) | set(range(0x20, 0x7f))
+    faces, preloads, saved = [], [], 0
+    for family, weight, style, src in get_font_files():
+        if family.lower() not in css.lower():
+            continue
+        if font_subset is None or not os.path.isfile(src):
+            print(f'Cannot self-host {family} {weight} {style}: ' +
+                  ('fontTools is not installed.' if font_subset is None else f'{src} not found.'))
+            return html
+        path = subset_font(src, codepoints)
+        saved += os.path.getsize(src) - os.path.getsize(path)
+        faces.append(f"@font-face{{font-family:'{family}';font-style:{style};font-weight:{weight};"
+                     f"font-display:swap;src:url({path}) format('woff2')}}")
+        if (weight, style) == (400, 'normal'):
+            preloads.append(f'<link rel="preload" href="{path}" as="font" type="font/woff2" crossorigin>')
+
+    head = ''.join(f'{link}\n    ' for link in preloads) + (f'<style>{"".join(faces)}</style>' if faces else '')
+    html = re.sub(r'<!-- Google Fonts -->.*?fonts\.googleapis\.com/css2[^>]*>\n?\s*', lambda m: head and head + '\n    ',
+                  html, count=1, flags=re.S)
+    print(f'Fonts: {len(faces)} self-hosted faces, {saved} bytes smaller than their sources.')
+    return html
+
+
+# File hashes by (absolute path, mtime, size), see clear_caches()
+_file_hashes = {}
+
+
+def hash_file(path):
+    """Content hash of a file (None if missing), memoized on mtime and size"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    if key not in _file_hashes:
+        with open(path, 'rb') as f:
+            _file_hashes[key] = hashlib.sha256(f.read()).hexdigest()
+    return _file_hashes[key]
+
+
+def clear_caches():
+    """Drop the in-process memos (parsed bibs, file hashes, image sizes, author index and name keys)"""
+    for memo in (_name_keys, _author_indexes, _coauthor_names, _bibs, _image_sizes, _measured_sizes, _file_hashes):
+        memo.clear()
+
+
+def get_referenced_files(html):
+    """Local files (images etc.) referenced by src attributes in rendered html"""
+    return sorted(set(p for p in re.findall(r'src="([^"]+)"', html) if ':' not in p and not p.startswith('#')))
+
+
+def get_fragments():
+    """Index page fragments: name -> (chunk renderer, input files, executor kind)"""
+    return {
+        'news': (iter_news_html, [get_input('news')], 'thread'),
+        'preprints': (iter_preprints_html, [get_input('preprints'), get_input('authors')], 'process'),
+        'publications': (iter_publications_html, [get_input('preprints'), get_input('publications'),
+                                                  get_input('authors')], 'process'),
+        'talks': (iter_talks_html, [get_input('talks')], 'process'),
+        'awards': (iter_awards_html, [get_input('awards')], 'process'),
+        'blog': (iter_blog_html, sorted(glob.glob(f'{POST_DIR}/*.md')), 'thread'),
+        'css': (lambda: [get_page_css()], [], 'thread'),
+    }
+
+
+def is_fragment_fresh(name, inputs, manifest):
+    """True if the manifest copy of a fragment was rendered from the current inputs"""
+    cached = manifest.get(name)
+    return bool(cached) and set(inputs) <= set(cached['inputs']) and \
+        all(hash_file(path) == h for path, h in cached['inputs'].items())
+
+
+def hash_fragment_inputs(output, inputs):
+    """{path: hash} of everything a rendered fragment depends on, for is_fragment_fresh()
+
+    Called where the fragment was rendered, so the bibs are already parsed (in a worker process too).
+    """
+    paths = [__file__] + inputs + get_referenced_files(output)
+    # Source images too, as variants are named by source hash but rendered markup isn't
+    paths += [e.fields['img'] for path in inputs if path.endswith('.bib')
+              for e in load_bib(path).values() if 'img' in e.fields]
+    return {path: hash_file(path) for path in paths}
+
+
+def render_fragment(name):
+    """Render one fragment by name"""
+    with profile_stage(name):
+        return ''.join(get_fragments()[name][0]())
+
+
+def render_fragment_in_worker(name):
+    """Picklable entry point for worker processes: the fragment, its input hashes and the image sizes it measured"""
+    output = render_fragment(name)
+    inputs = hash_fragment_inputs(output, get_fragments()[name][1])
+    sizes = dict(_measured_sizes)
+    _measured_sizes.clear()
+    return output, inputs, sizes
+
+
+def init_worker(options):
+    build_options.update(options)
+
+
+def render_fragments(manifest=None, jobs=1):
+    """Render stale fragments, concurrently if jobs > 1, and return all of them in page order.
+
+    pybtex-bound sections go to a process pool, the file-reading ones to a thread pool.
+    """
+    manifest = {} if manifest is None else manifest
+    fragments = get_fragments()
+    stale = [name for name, (_, inputs, _) in fragments.items() if not is_fragment_fresh(name, inputs, manifest)]
+
+    if jobs > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=(dict(build_options),)) as processes, \
+                ThreadPoolExecutor(jobs) as threads:
+            futures = {name: processes.submit(render_fragment_in_worker, name) if fragments[name][2] == 'process'
+                       else threads.submit(render_fragment, name) for name in stale}
+            outputs = {name: future.result() for name, future in futures.items()}
+    else:
+        outputs = {name: render_fragment(name) for name in stale}
+
+    for name in stale:
+        if isinstance(outputs[name], tuple):
+            output, inputs, sizes = outputs[name]
+            add_measured_sizes(sizes)
+        else:
+            output, inputs = outputs[name], hash_fragment_inputs(outputs[name], fragments[name][1])
+        manifest[name] = {'inputs': inputs, 'output': output}
+    return {name: manifest[name]['output'] for name in fragments}
+
+
+def stream_fragments():
+    """Unrendered fragments as lazy chunk iterators, consumed while the page is written"""
+    return {name: render() for name, (render, _, _) in get_fragments().items()}
+
+
+def load_manifest(filename=os.path.join(BUILD_DIR, 'manifest.json')):
+    try:
+        with open(filename, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, filename=os.path.join(BUILD_DIR, 'manifest.json')):
+    """Write atomically, as batch builds share some of these files between processes"""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp, filename)
+
+
+def iter_fragment(fragment):
+    if isinstance(fragment, str):
+        yield fragment
+    else:
+        yield from fragment
+
+
+def iter_index_html(fragments=None):
+    """Chunks of the index page, streaming each fragment in place"""
+    data = get_personal_data()
+    fragments = render_fragments() if fragments is None else fragments
+    yield f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -998,14 +2655,16 @@ def get_index_html():
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
 
     <style>
-    {css}
+    '''
+    yield from iter_fragment(fragments['css'])
+    yield f'''
     </style>
 </head>
 <body>
     <!-- Navigation -->
     <nav class="navbar">
         <div class="nav-container">
-            <a href="#" class="nav-brand">{data['name'][0]} {data['name'][1]}</a>
+            <a href="#" class="nav-brand">{data['name'][0]} {data['name'][1]}</a>{get_search_html() if build_options['search'] else ''}
             <div class="nav-links">
                 <a href="#about" class="active">About</a>
                 <a href="#publications">Publications</a>
@@ -1020,7 +2679,7 @@ def get_index_html():
         <section id="about" class="profile-section">
             <div class="profile-header">
                 <div class="profile-image">
-                    <img src="assets/img/profile2.jpg" alt="{data['name'][0]} {data['name'][1]}">
+                    {get_img_html(get_input('profile_image'), f"{data['name'][0]} {data['name'][1]}", lazy=False)}
                 </div>
                 <div class="profile-info">
                     <h1>{data['name'][0]} {data['name'][1]}</h1>
@@ -1052,7 +2711,9 @@ def get_index_html():
         <!-- News Section -->
         <section class="section">
             <h2 class="section-header">News</h2>
-            {news}
+            '''
+    yield from iter_fragment(fragments['news'])
+    yield f'''
         </section>
         
         <!-- Selected Publications -->
@@ -1063,28 +2724,38 @@ def get_index_html():
             </p>
             
             <h3 style="font-size: 1.1rem; color: var(--muted); margin-bottom: 1rem; font-weight: 600;">Preprints</h3>
-            {prep}
+            '''
+    yield from iter_fragment(fragments['preprints'])
+    yield f'''
             
             <h3 style="font-size: 1.1rem; color: var(--muted); margin: 2rem 0 1rem; font-weight: 600;">Peer-Reviewed</h3>
-                        {pub}
+                        '''
+    yield from iter_fragment(fragments['publications'])
+    yield f'''
         </section>
         
         <!-- Awards Section -->
         <section id="awards" class="section">
             <h2 class="section-header">Awards</h2>
-                        {awards}
+                        '''
+    yield from iter_fragment(fragments['awards'])
+    yield f'''
         </section>
         
         <!-- Talks Section -->
         <section class="section">
             <h2 class="section-header">Talks</h2>
-                        {talks}
+                        '''
+    yield from iter_fragment(fragments['talks'])
+    yield f'''
         </section>
         
         <!-- Blog Section -->
         <section id="blog" class="section">
             <h2 class="section-header">Blog</h2>
-            {blog}
+            '''
+    yield from iter_fragment(fragments['blog'])
+    yield f'''
         </section>
     </div>
 
@@ -1118,26 +2789,42 @@ def get_index_html():
             }});
         }});
         
-        // Update active nav link on scroll
-        window.addEventListener('scroll', () => {{
-            const sections = document.querySelectorAll('section[id]');
-            const navLinks = document.querySelectorAll('.nav-links a');
-            
-            let current = '';
-            sections.forEach(section => {{
-                const sectionTop = section.offsetTop;
-                if (scrollY >= sectionTop - 200) {{
-                    current = section.getAttribute('id');
-                }}
-            }});
-            
-            navLinks.forEach(link => {{
-                link.classList.remove('active');
-                if (link.getAttribute('href') === '#' + current) {{
-                    link.classList.add('active');
-                }}
-            }});
-        }});
+        // Update active nav link: the last section whose top passed a line 200px below the
+        // viewport top, tracked by an observer on that line instead of reading layout on scroll
+        const sections = Array.from(document.querySelectorAll('section[id]'));
+        const navLinks = Array.from(document.querySelectorAll('.nav-links a'));
+        const activeLine = 200;
+        let current = -1;
+        let sectionObserver = null;
+        
+        function setActive(index) {{
+            const id = index >= 0 ? '#' + sections[index].id : null;
+            navLinks.forEach(link => link.classList.toggle('active', link.getAttribute('href') === id));
+        }}
+        
+        function observeSections() {{
+            if (sectionObserver) sectionObserver.disconnect();
+            const bottom = Math.max(0, window.innerHeight - activeLine - 1);
+            sectionObserver = new IntersectionObserver(entries => {{
+                entries.forEach(entry => {{
+                    const index = sections.indexOf(entry.target);
+                    if (entry.isIntersecting) {{
+                        current = index;
+                    }} else if (entry.boundingClientRect.top > activeLine) {{
+                        current = Math.min(current, index - 1);
+                    }} else {{
+                        current = Math.max(current, index);
+                    }}
+                }});
+                setActive(current);
+            }}, {{ rootMargin: `-${{activeLine}}px 0px -${{bottom}}px 0px` }});
+            sections.forEach(section => sectionObserver.observe(section));
+        }}
+        
+        if ('IntersectionObserver' in window) {{
+            observeSections();
+            window.addEventListener('resize', observeSections, {{ passive: true }});
+        }}
         
         // Handle direct URL hash on page load
         if (window.location.hash) {{
@@ -1148,19 +2835,433 @@ def get_index_html():
                 }}, 100);
             }}
         }}
-    </script>
+{get_search_js() if build_options['search'] else ''}{get_pagination_js() if build_options['paginate_publications'] else ''}    </script>
 </body>
 </html>
 '''
-    return s
 
 
-def write_index_html(filename='index.html'):
-    s = get_index_html()
-    with open(filename, 'w') as f:
-        f.write(s)
+def get_index_html(fragments=None):
+    return ''.join(iter_index_html(fragments))
+
+
+def write_chunks(filename, chunks, buffering=1 << 16):
+    """Write chunks through a buffered file, replacing filename only once complete"""
+    tmp = filename + '.tmp'
+    with open(tmp, 'w', buffering=buffering) as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, filename)
+
+
+def remove_output(path):
+    """Delete a generated file along with its precompressed sidecars"""
+    for p in (path,) + tuple(path + ext for ext in PRECOMPRESS_EXTS):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def get_page_stages():
+    """Post-render stages over the whole page, in order: (stage, enabled)"""
+    return [
+        (inline_icon_sprite, build_options['icon_sprite']),
+        (extract_critical_css, build_options['critical_css']),
+        (self_host_fonts, build_options['self_host_fonts']),
+        (minify_page_css, build_options['minify_css']),
+        (fingerprint_index_html, build_options['fingerprint']),
+        (minify_index_html, bool(get_minify_mode('index'))),
+    ]
+
+
+def postprocess_html(chunks):
+    """Run the enabled page stages; without any, chunks pass through unmaterialized"""
+    stages = [stage for stage, enabled in get_page_stages() if enabled]
+    if not stages:
+        return chunks
+    with profile_stage('assemble page'):
+        html = ''.join(chunks)
+    for stage in stages:
+        with profile_stage(stage.__name__):
+            html = stage(html)
+    return [html]
+
+
+def write_index_html(filename='index.html', incremental=True, jobs=1):
+    if not incremental and jobs == 1 and not build_options['profile']:
+        write_chunks(filename, postprocess_html(iter_index_html(stream_fragments())))
+        print(f'Written index content to {filename}.')
+        return
+
+    manifest = load_manifest() if incremental else {}
+    options = {k: v for k, v in build_options.items() if k != 'cache'}
+    if manifest.get('_options') != options:
+        manifest = {'_options': options}
+    previous = dict(manifest)
+    fragments = render_fragments(manifest, jobs=jobs)
+    chunks = postprocess_html(iter_index_html(fragments))
+    with profile_stage(f'write {filename}'):
+        write_chunks(filename, chunks)
+    if incremental:
+        save_manifest(manifest)
+        rendered = [name for name in fragments if manifest[name] is not previous.get(name)]
+        print(f'Rendered {len(rendered)}/{len(fragments)} fragments' + (f' ({", ".join(rendered)})' if rendered else '') + '.')
     print(f'Written index content to {filename}.')
 
 
+def precompress_outputs(patterns=PRECOMPRESS_PATTERNS):
+    """Write max-level gzip and Brotli sidecars next to generated files, skipping unchanged sources
+
+    The state records, per file, its hash, the compressors tried and the sidecars kept, so files whose
+    sidecars were dropped as not smaller aren't compressed again on every build.
+    """
+    state_file = os.path.join(BUILD_DIR, 'precompressed.json')
+    state = load_manifest(state_file) if build_options['cache'] else {}
+    compressors = {'.gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors['.br'] = lambda data: brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+    paths = sorted({path for pattern in patterns for path in glob.glob(pattern, recursive=True)})
+    written = 0
+    for path in paths:
+        digest = hash_file(path)
+        old = state.get(path)
+        if isinstance(old, list) and old[:2] == [digest, list(compressors)] and \
+                all(os.path.exists(path + ext) for ext in old[2]):
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        kept = []
+        for ext, compress in compressors.items():
+            packed = compress(data)
+            if len(packed) < len(data):
+                with open(path + ext, 'wb') as f:
+                    f.write(packed)
+                kept.append(ext)
+                written += 1
+            elif os.path.exists(path + ext):
+                os.remove(path + ext)  # Not worth it (tiny file), let the server send the original
+        state[path] = [digest, list(compressors), kept]
+
+    if build_options['cache']:
+        save_manifest({path: state[path] for path in paths}, state_file)
+    print(f'Precompressed {written} sidecars ({", ".join(compressors)}) for {len(paths)} files.')
+
+
+# Inputs watched by `build.py serve`; outputs written under assets/ must not match these or sit in WATCH_EXCLUDE_DIRS
+WATCH_PATTERNS = ['build.py', '*.bib', f'{POST_DIR}/*.md', 'assets/img/**/*', f'{ICON_DIR}/**/*.svg',
+                  f'{FONT_DIR}/src/*']
+WATCH_EXCLUDE_DIRS = [IMAGE_VARIANT_DIR]
+LIVE_RELOAD_PATH = '/__livereload'
+LIVE_RELOAD_SCRIPT = '''<script>
+(function connect(restarted) {
+    const socket = new WebSocket(`ws://${location.host}%s`);
+    socket.onopen = () => { if (restarted) location.reload(); };
+    socket.onmessage = () => location.reload();
+    socket.onclose = () => setTimeout(() => connect(true), 500);
+})(false);
+</script>
+''' % LIVE_RELOAD_PATH
+
+
+def build(jobs=1):
+    """Build the blog pages and index.html with the current build_options"""
+    with profile_stage('blog pages'):
+        write_blog_pages()
+    write_index_html('index.html', incremental=build_options['cache'], jobs=jobs)
+    save_image_sizes()
+    if build_options['precompress']:
+        with profile_stage('precompress'):
+            precompress_outputs()
+
+
+@contextlib.contextmanager
+def profile_stage(name):
+    """With --profile, record wall and CPU time, net allocations and peak memory of the enclosed stage"""
+    if not build_options['profile']:
+        yield
+        return
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        current, peak = tracemalloc.get_traced_memory()
+        profile_stages.append((name, wall, cpu, current - base, peak - base))
+
+
+def print_profile():
+    """Table of the stages recorded by profile_stage(), slowest first"""
+    print(f'\n{"stage":<24}{"wall (ms)":>11}{"cpu (ms)":>11}{"alloc (KiB)":>13}{"peak (KiB)":>12}')
+    for name, wall, cpu, allocated, peak in sorted(profile_stages, key=lambda s: -s[1]):
+        print(f'{name:<24}{wall * 1000:>11.1f}{cpu * 1000:>11.1f}{allocated / 1024:>13.1f}{peak / 1024:>12.1f}')
+    print('(Times include tracemalloc overhead.)')
+
+
+class LiveReloadHandler(SimpleHTTPRequestHandler):
+    """Static file handler that injects the live reload client into pages and serves its websocket"""
+    protocol_version = 'HTTP/1.1'  # Browsers refuse websocket upgrades over HTTP/1.0
+    generation = 0  # Bumped after every successful rebuild
+    rebuilt = threading.Condition()
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split('?')[0].split('#')[0]
+        if path == LIVE_RELOAD_PATH and self.headers.get('Upgrade', '').lower() == 'websocket':
+            return self.serve_websocket()
+        filename = self.translate_path(path)
+        if os.path.isdir(filename):
+            filename = os.path.join(filename, 'index.html')
+        if not filename.endswith('.html') or not os.path.isfile(filename) or not path.endswith(('/', '.html')):
+            return super().do_GET()
+        with open(filename, 'rb') as f:
+            page = f.read().replace(b'</body>', LIVE_RELOAD_SCRIPT.encode() + b'</body>', 1)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def serve_websocket(self):
+        """Minimal RFC 6455 server side: handshake, then one 'reload' text frame after the next rebuild"""
+        key = self.headers.get('Sec-WebSocket-Key', '') + '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+        self.send_response(101, 'Switching Protocols')
+        self.send_header('Upgrade', 'websocket')
+        self.send_header('Connection', 'Upgrade')
+        self.send_header('Sec-WebSocket-Accept', base64.b64encode(hashlib.sha1(key.encode()).digest()).decode())
+        super().end_headers()
+        self.wfile.flush()
+        self.close_connection = True
+        seen = LiveReloadHandler.generation
+        try:
+            while True:
+                with LiveReloadHandler.rebuilt:
+                    LiveReloadHandler.rebuilt.wait_for(lambda: LiveReloadHandler.generation != seen, timeout=30)
+                if LiveReloadHandler.generation != seen:
+                    self.wfile.write(b'\x81\x06reload')
+                    self.wfile.flush()
+                    return
+                self.wfile.write(b'\x89\x00')  # Ping, so closed tabs are noticed and dropped
+                self.wfile.flush()
+        except OSError:
+            pass
+
+    @classmethod
+    def notify(cls):
+        with cls.rebuilt:
+            cls.generation += 1
+            cls.rebuilt.notify_all()
+
+
+def get_watched_files():
+    """{path: (mtime, size)} of the build inputs"""
+    files = {}
+    for pattern in WATCH_PATTERNS + [glob.escape(path) for path in build_options['inputs'].values()]:
+        for path in glob.glob(pattern, recursive=True):
+            if any(path.startswith(d + os.sep) for d in WATCH_EXCLUDE_DIRS):
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isdir(path):
+                files[path] = (st.st_mtime_ns, st.st_size)
+    return files
+
+
+def serve(port=8000, jobs=1, interval=0.2):
+    """Build, serve the site on localhost and rebuild on input changes, reloading open pages.
+
+    Fragments, bib files and blog posts are cached as in incremental builds, so a rebuild only renders
+    what changed. A change to build.py itself restarts the process to pick up the new code.
+    """
+    build(jobs)
+    server = ThreadingHTTPServer(('127.0.0.1', port), LiveReloadHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f'Serving on http://127.0.0.1:{port}/ (Ctrl+C to stop), watching for changes...')
+
+    files = get_watched_files()
+    try:
+        while True:
+            time.sleep(interval)
+            current = get_watched_files()
+            changed = sorted(path for path in files.keys() | current.keys() if files.get(path) != current.get(path))
+            files = current
+            if not changed:
+                continue
+            print(f'Changed: {", ".join(changed)}')
+            if os.path.abspath(__file__) in map(os.path.abspath, changed):
+                print('build.py changed, restarting...')
+                server.server_close()
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            start = time.perf_counter()
+            try:
+                build(jobs)
+            except Exception:
+                traceback.print_exc()
+                continue
+            print(f'Rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms.')
+            LiveReloadHandler.notify()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+def load_site_config(site_dir):
+    """Build options for one batch site from its SITE_CONFIG; input paths are relative to site_dir"""
+    with open(os.path.join(site_dir, SITE_CONFIG), 'r') as f:
+        config = json.load(f)
+    return {'inputs': dict(DEFAULT_INPUTS, **config.get('inputs', {})), 'personal': config.get('personal', {})}
+
+
+def build_site(site_dir):
+    """Build one batch site in its directory (picklable entry point for worker processes).
+
+    Returns (build log, traceback or None, seconds).
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    error = None
+    try:
+        os.chdir(site_dir)
+        build_options.update(load_site_config(site_dir))
+        with contextlib.redirect_stdout(log):
+            build()
+    except Exception:
+        error = traceback.format_exc()
+    return log.getvalue(), error, time.perf_counter() - start
+
+
+def build_sites(sites_dir, jobs=1):
+    """Build every <sites_dir>/<site>/SITE_CONFIG site, returning the number of failed builds.
+
+    Sites share parsed bibliographies, image sizes and variants, the compiled author index and
+    rendered blog blocks: in memory within a worker process, and on disk in <sites_dir>/BUILD_DIR.
+    Fragment manifests and outputs stay in each site's directory.
+    """
+    site_dirs = sorted(os.path.dirname(os.path.abspath(path)) for path in glob.glob(os.path.join(sites_dir, '*', SITE_CONFIG)))
+    if not site_dirs:
+        print(f'No sites found: expected {os.path.join(sites_dir, "<site>", SITE_CONFIG)}.')
+        return 1
+    build_options['shared_cache'] = os.path.abspath(os.path.join(sites_dir, BUILD_DIR))
+    cwd = os.getcwd()
+    failed = 0
+
+    def report(site_dir, result):
+        log, error, seconds = result
+        name = os.path.basename(site_dir)
+        print(f'[{name}] ' + f'\n[{name}] '.join((log + (error or '')).rstrip().splitlines()))
+        print(f'[{name}] {"failed" if error else "built"} in {seconds:.2f} s.')
+        return 1 if error else 0
+
+    if jobs > 1 and len(site_dirs) > 1:
+        with ProcessPoolExecutor(min(jobs, len(site_dirs)), initializer=init_worker,
+                                 initargs=(dict(build_options),)) as pool:
+            futures = {pool.submit(build_site, site_dir): site_dir for site_dir in site_dirs}
+            for future in as_completed(futures):
+                failed += report(futures[future], future.result())
+    else:
+        try:
+            for site_dir in site_dirs:
+                failed += report(site_dir, build_site(site_dir))
+        finally:
+            os.chdir(cwd)
+    print(f'Built {len(site_dirs) - failed}/{len(site_dirs)} sites.')
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the homepage index.html.')
+    parser.add_argument('command', nargs='?', choices=['build', 'serve', 'batch'], default='build',
+                        help="'serve' also serves the site on localhost, rebuilding and reloading the browser on changes; "
+                             f"'batch' builds every SITES/<site>/ directory that has a {SITE_CONFIG}")
+    parser.add_argument('sites', nargs='?', metavar='SITES', help="directory of sites for 'batch'")
+    parser.add_argument('--port', type=int, default=8000, help='port for serve (default: 8000)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'ignore and do not write the parsed-bib cache and fragment manifest in {BUILD_DIR}/')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='render index sections concurrently with N workers (0: one per CPU)')
+    parser.add_argument('--gif-video', action='store_true',
+                        help='transcode animated GIF thumbnails to looping WebM/MP4 <video> (needs ffmpeg)')
+    parser.add_argument('--minify-css', action='store_true',
+                        help='drop CSS rules that match nothing in the page and minify the rest')
+    parser.add_argument('--critical-css', action='store_true',
+                        help=f'inline only above-the-fold CSS and defer a content-hashed stylesheet in {CSS_DIR}/, '
+                             'which the blog pages link too')
+    parser.add_argument('--self-host-fonts', action='store_true',
+                        help=f'serve WOFF2 subsets of the fonts in {FONT_DIR}/src/ instead of Google Fonts (needs fontTools, brotli)')
+    parser.add_argument('--icon-sprite', action='store_true',
+                        help=f'replace the Font Awesome CDN with an inline SVG sprite of the icons used, from {ICON_DIR}/')
+    parser.add_argument('--minify-html', metavar='[OUTPUT=]MODE', action='append', default=[],
+                        help="minify generated HTML: MODE is 'safe' or 'aggressive', optionally for one OUTPUT "
+                             "('index' or 'blog'), e.g. --minify-html safe --minify-html index=aggressive")
+    parser.add_argument('--precompress', action='store_true',
+                        help='write .gz and .br (needs brotli) sidecars of generated HTML/CSS/JS/SVG files')
+    parser.add_argument('--fingerprint', action='store_true',
+                        help=f'reference content-hashed copies of assets (in {FINGERPRINT_DIR}/) and write '
+                             f'{ASSET_MANIFEST} plus immutable caching rules in {HEADERS_FILE}')
+    parser.add_argument('--search', action='store_true',
+                        help=f'add a search box over publications and blog posts, backed by a prebuilt index in {SEARCH_DIR}/')
+    parser.add_argument('--paginate-publications', type=int, default=0, metavar='N',
+                        help=f'render only the first N peer-reviewed entries inline and fetch the rest in chunks '
+                             f'of N from {PUB_CHUNK_DIR}/ on scroll, "show all" or a #pub- link')
+    parser.add_argument('--profile', action='store_true',
+                        help='render everything from scratch, sequentially, and report wall/CPU time and memory per stage')
+    parser.add_argument('--profile-dump', metavar='FILE',
+                        help='with --profile, also write cProfile stats to FILE (for pstats, snakeviz or flameprof)')
+    parser.add_argument('--responsive-images', action='store_true',
+                        help=f'emit <picture> markup with resized AVIF/WebP/JPEG variants in {IMAGE_VARIANT_DIR}/ (needs Pillow)')
+    args = parser.parse_args(argv)
+
+    build_options['cache'] = not args.no_cache
+    build_options['responsive_images'] = args.responsive_images
+    build_options['gif_video'] = args.gif_video
+    build_options['minify_css'] = args.minify_css
+    build_options['critical_css'] = args.critical_css
+    build_options['self_host_fonts'] = args.self_host_fonts
+    build_options['icon_sprite'] = args.icon_sprite
+    build_options['precompress'] = args.precompress
+    build_options['fingerprint'] = args.fingerprint
+    build_options['search'] = args.search
+    build_options['paginate_publications'] = max(args.paginate_publications, 0)
+    for setting in args.minify_html:
+        output, _, mode = setting.rpartition('=')
+        if mode not in ('safe', 'aggressive'):
+            parser.error(f'unknown --minify-html mode {mode!r}')
+        build_options['minify_html'][output or '*'] = mode
+    if args.gif_video and shutil.which('ffmpeg') is None:
+        print('ffmpeg not found, --gif-video has no effect.')
+    if args.responsive_images and Image is None:
+        print('Pillow is not installed, --responsive-images has no effect.')
+    jobs = args.jobs or os.cpu_count()
+    if (args.command == 'batch') != bool(args.sites):
+        parser.error("'batch' and a SITES directory go together")
+    if args.command == 'batch':
+        sys.exit(1 if build_sites(args.sites, jobs) else 0)
+    elif args.command == 'serve':
+        serve(args.port, jobs)
+    elif args.profile or args.profile_dump:
+        build_options['profile'] = True
+        build_options['cache'] = False
+        profiler = cProfile.Profile() if args.profile_dump else None
+        tracemalloc.start()
+        with profiler or contextlib.nullcontext():
+            build(jobs=1)
+        tracemalloc.stop()
+        print_profile()
+        if profiler:
+            profiler.dump_stats(args.profile_dump)
+            print(f'cProfile stats written to {args.profile_dump}.')
+    else:
+        build(jobs)
+
+
 if __name__ == '__main__':
-    write_index_html('index.html')
+    main()